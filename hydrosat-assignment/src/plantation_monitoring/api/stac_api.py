@@ -1,33 +1,175 @@
 """FastAPI application for querying STAC catalog from S3.
 
-This API reads directly from S3 on each request, so new data pushed to S3
-will be immediately available without restarting the API server.
+This API re-lists S3 once the current item snapshot is older than
+SNAPSHOT_TTL_SECONDS, so new data pushed to S3 becomes available within
+that window without restarting the API server. Parsed items are
+cached in-process and only re-downloaded when their ETag changes. The cache
+is also persisted to S3 as a single index object so cold workers can seed
+it with one GET instead of downloading every item.
+
+Endpoints are async: blocking boto3 calls are offloaded to worker threads
+while filtering runs on the event loop against in-memory indexes.
 """
 
-import json
-from datetime import datetime as dt
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime as dt, timezone
+from email.utils import format_datetime
 from typing import Any
 
+import numpy as np
+import orjson
 from botocore.exceptions import ClientError
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from pydantic import BaseModel, Field as PydanticField
+from shapely import STRtree, box
 
 from plantation_monitoring.connectors.s3_client import S3Resource
 from plantation_monitoring.connectors.settings import SettingsResource
 
 COLLECTION_ID = "field-indices"
 ITEMS_PREFIX = "catalog/items/"
+ITEM_INDEX_KEY = "catalog/index/items.json"
+MAX_FETCH_WORKERS = 32
+PRESIGNED_URL_EXPIRY_SECONDS = 300
+CACHE_CONTROL = "public, max-age=30"
+SNAPSHOT_TTL_SECONDS = 30.0
+SNAPSHOT_MAX_ENTRIES = 64
+ITEM_INDEX_SAVE_INTERVAL_SECONDS = 300.0
+BBOX_TREE_MIN_ITEMS = 5000
+DATE_PREFIX_PATTERN = re.compile(r"^(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?$")
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="STAC API",
     description="STAC catalog API for querying field spectral indices",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 settings = SettingsResource.create(swallow_errors=True)
 s3_resource = S3Resource(settings=settings)
 s3_client = s3_resource.get_client()
 bucket_name = settings.aws_s3_pipeline_bucket_name
 
+_ITEM_CACHE: dict[str, tuple[str, dict[str, Any]]] = {}
+_ITEM_CACHE_LOCK = threading.Lock()
+_ITEM_INDEX_STATE: dict[str, Any] = {"etag": None, "saved_at": float("-inf"), "dirty": False, "loaded": False}
+
+
+class SearchBody(BaseModel):
+    """Search request body.
+
+    :param field_id: Filter by field ID
+    :param index_type: Filter by index type (NDVI, NDMI)
+    :param datetime: Datetime filter (prefix or ISO 8601 interval)
+    :param bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
+    :param limit: Maximum number of items
+    :param offset: Number of matching items to skip
+    """
+
+    field_id: str | None = None
+    index_type: str | None = None
+    datetime: str | None = None
+    bbox: list[float] | None = PydanticField(default=None, min_length=4, max_length=4)
+    limit: int = PydanticField(default=10, ge=1, le=1000)
+    offset: int = PydanticField(default=0, ge=0)
+
+
+def _parse_datetime(value: str) -> dt | None:
+    """Parse ISO 8601 datetime, treating naive values as UTC.
+
+    :param value: Datetime string
+    :returns: Timezone-aware datetime or None if unparsable
+    """
+    try:
+        parsed = dt.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
+class ItemRow:
+    """Flat view of the STAC item fields used for filtering.
+
+    :param field_id: Field ID property
+    :param index_type: Index type property
+    :param datetime_string: Raw datetime property, empty if missing
+    :param datetime: Parsed datetime or None if unparsable
+    :param bbox: Item bbox as [min_lon, min_lat, max_lon, max_lat] or NaNs if missing
+    """
+
+    field_id: str | None
+    index_type: str | None
+    datetime_string: str
+    datetime: dt | None
+    bbox: tuple[float, float, float, float]
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> "ItemRow":
+        """Create row from STAC item.
+
+        :param item: STAC item dictionary
+        :returns: ItemRow instance
+        """
+        properties = item.get("properties") or {}
+        datetime_string = properties.get("datetime") or ""
+        bbox = item.get("bbox") or ()
+        return cls(
+            field_id=properties.get("field_id"),
+            index_type=properties.get("index_type"),
+            datetime_string=datetime_string,
+            datetime=_parse_datetime(datetime_string),
+            bbox=tuple(bbox) if len(bbox) == 4 else (np.nan,) * 4,
+        )
+
+
+class _ItemSnapshot:
+    """Listed STAC items together with the indexes built over them."""
+
+    def __init__(self, items: list[dict[str, Any]], etag: str = "") -> None:
+        self.items = items
+        self.etag = etag
+        self.rows = [ItemRow.from_item(item) for item in items]
+        self.bboxes = np.array([row.bbox for row in self.rows], dtype=np.float64).reshape(-1, 4)
+        self.bbox_tree = None
+        if len(items) >= BBOX_TREE_MIN_ITEMS:
+            self.bbox_tree = STRtree(box(*self.bboxes.T))
+        self.field_id_index: dict[str | None, set[int]] = {}
+        self.index_type_index: dict[str | None, set[int]] = {}
+        for i, row in enumerate(self.rows):
+            self.field_id_index.setdefault(row.field_id, set()).add(i)
+            self.index_type_index.setdefault(row.index_type, set()).add(i)
+        by_datetime = sorted((row.datetime, i) for i, row in enumerate(self.rows) if row.datetime is not None)
+        self.sorted_datetimes = [d for d, _ in by_datetime]
+        self.sorted_ids = [i for _, i in by_datetime]
+        by_datetime_string = sorted((row.datetime_string, i) for i, row in enumerate(self.rows) if row.datetime_string)
+        self.sorted_datetime_strings = [d for d, _ in by_datetime_string]
+        self.sorted_datetime_string_ids = [i for _, i in by_datetime_string]
+
+
+# Snapshots are kept in least-recently-used order and capped at
+# SNAPSHOT_MAX_ENTRIES, since prefixes are derived from request filters.
+# Refresh locks are only referenced weakly, so a lock disappears once no
+# coroutine holds or waits on it.
+_SNAPSHOTS: OrderedDict[str, _ItemSnapshot] = OrderedDict()
+_SNAPSHOT_EXPIRES_AT: dict[str, float] = {}
+_SNAPSHOT_LOCKS: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
 
 def _load_json_from_s3(key: str) -> dict[str, Any]:
     """Load JSON object from S3.
@@ -36,126 +178,418 @@ def _load_json_from_s3(key: str) -> dict[str, Any]:
     :returns: JSON dictionary
     :raises HTTPException: If object not found
     """
+    return _load_json_with_metadata_from_s3(key)[0]
+
+
+def _load_json_with_metadata_from_s3(key: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load JSON object from S3 together with the object's response metadata.
+
+    :param key: S3 key
+    :returns: Tuple of (JSON dictionary, GetObject response without body)
+    :raises HTTPException: If object not found
+    """
     try:
         response = s3_client.get_object(Bucket=bucket_name, Key=key)
-        content = response["Body"].read().decode("utf-8")
-        result: dict[str, Any] = json.loads(content)
-        return result
+        result: dict[str, Any] = orjson.loads(response.pop("Body").read())
+        return result, response
     except ClientError as e:
         if e.response.get("Error", {}).get("Code") == "NoSuchKey":
             raise HTTPException(status_code=404, detail=f"STAC object not found: {key}") from e
         raise HTTPException(status_code=500, detail=f"Error loading from S3: {e}") from e
 
 
-def _filter_by_datetime(items: list[dict[str, Any]], datetime_filter: str) -> list[dict[str, Any]]:
+def _filter_by_datetime(snapshot: _ItemSnapshot, datetime_filter: str) -> set[int]:
     """Filter items by datetime.
 
-    Supports prefix matching (e.g., "2025-01") and ISO 8601 intervals.
+    Supports prefix matching (e.g., "2025-01") and ISO 8601 intervals. Prefixes
+    match the item's datetime string as written, so its local date counts;
+    intervals compare timezone-aware datetimes. Both are answered by bisecting
+    the snapshot's sorted datetime strings or datetimes.
 
-    :param items: List of STAC items
+    :param snapshot: Item snapshot
     :param datetime_filter: Datetime filter string
-    :returns: Filtered items
+    :returns: Indices of matching items
+    """
+    if "/" in datetime_filter:
+        start_str, end_str = datetime_filter.split("/", 1)
+        start_dt, end_dt = _parse_datetime(start_str), _parse_datetime(end_str)
+        if start_dt is None or end_dt is None:
+            return set()
+        sorted_datetimes = snapshot.sorted_datetimes
+        lo, hi = bisect_left(sorted_datetimes, start_dt), bisect_right(sorted_datetimes, end_dt)
+        return set(snapshot.sorted_ids[lo:hi])
+    # Every string starting with the prefix sorts between it and the prefix
+    # followed by the highest code point
+    sorted_strings = snapshot.sorted_datetime_strings
+    lo, hi = bisect_left(sorted_strings, datetime_filter), bisect_right(sorted_strings, f"{datetime_filter}\U0010ffff")
+    return set(snapshot.sorted_datetime_string_ids[lo:hi])
+
+
+def _filter_by_bbox(snapshot: _ItemSnapshot, bbox: list[float]) -> set[int]:
+    """Filter items whose bounding box lies within the query bbox.
+
+    Small snapshots are scanned with vectorised comparisons over the bbox
+    array; large ones are answered from the STRtree. Items without a bbox
+    never match.
+
+    :param snapshot: Item snapshot
+    :param bbox: Query bbox [min_lon, min_lat, max_lon, max_lat]
+    :returns: Indices of matching items
     """
-    filtered = []
-    for item in items:
-        item_datetime = item.get("properties", {}).get("datetime", "")
-        if not item_datetime:
-            continue
-
-        if "/" in datetime_filter:
-            start_str, end_str = datetime_filter.split("/", 1)
-            try:
-                start_dt = dt.fromisoformat(start_str.replace("Z", "+00:00").replace("T", " "))
-                end_dt = dt.fromisoformat(end_str.replace("Z", "+00:00").replace("T", " "))
-                item_dt = dt.fromisoformat(item_datetime.replace("Z", "+00:00").replace("T", " "))
-                if start_dt <= item_dt <= end_dt:
-                    filtered.append(item)
-            except (ValueError, AttributeError):
-                continue
-        elif item_datetime.startswith(datetime_filter):
-            filtered.append(item)
-
-    return filtered
-
-
-def _list_items() -> list[dict[str, Any]]:
-    """List all STAC items from S3.
+    if snapshot.bbox_tree is not None:
+        return set(snapshot.bbox_tree.query(box(*bbox), predicate="covers").tolist())
+    bboxes = snapshot.bboxes
+    mask = (
+        (bboxes[:, 0] >= bbox[0]) & (bboxes[:, 1] >= bbox[1]) & (bboxes[:, 2] <= bbox[2]) & (bboxes[:, 3] <= bbox[3])
+    )
+    return set(np.flatnonzero(mask).tolist())
+
+
+def _fetch_item(key: str) -> dict[str, Any] | None:
+    """Load STAC item from S3, returning None if it cannot be read.
+
+    :param key: S3 key
+    :returns: STAC item dictionary or None
+    """
+    try:
+        return _load_json_from_s3(key)
+    except HTTPException:
+        return None
+
+
+def _load_item_index() -> None:
+    """Seed the item cache from the persisted index object.
+
+    Entries are keyed by S3 key and ETag, so anything stale is simply
+    re-downloaded by _list_items. A missing or unreadable index is ignored.
+    The index object's own ETag is remembered for the next conditional save.
+    """
+    try:
+        index, response = _load_json_with_metadata_from_s3(ITEM_INDEX_KEY)
+    except HTTPException:
+        return
+    with _ITEM_CACHE_LOCK:
+        _ITEM_INDEX_STATE["etag"] = response.get("ETag")
+        for key, (etag, item) in index.items():
+            _ITEM_CACHE.setdefault(key, (etag, item))
+
+
+def _save_item_index() -> None:
+    """Persist the item cache to S3 so other workers can seed from it.
+
+    The index carries every item body, so it is only written after a complete
+    catalog listing, only if the cache changed, and at most once per
+    ITEM_INDEX_SAVE_INTERVAL_SECONDS. The write is conditional on the index
+    version this worker last read or wrote; if another worker replaced it in
+    the meantime, that version is adopted instead of being overwritten.
+    """
+    now = time.monotonic()
+    with _ITEM_CACHE_LOCK:
+        if not _ITEM_INDEX_STATE["dirty"] or now - _ITEM_INDEX_STATE["saved_at"] < ITEM_INDEX_SAVE_INTERVAL_SECONDS:
+            return
+        entries = dict(_ITEM_CACHE)
+        index_etag = _ITEM_INDEX_STATE["etag"]
+    condition = {"IfMatch": index_etag} if index_etag else {"IfNoneMatch": "*"}
+    try:
+        response = s3_client.put_object(
+            Bucket=bucket_name,
+            Key=ITEM_INDEX_KEY,
+            Body=orjson.dumps(entries),
+            ContentType="application/json",
+            **condition,
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in ("PreconditionFailed", "ConditionalRequestConflict"):
+            logger.warning(f"Failed to save STAC item index {ITEM_INDEX_KEY}: {e}")
+            return
+        logger.info(f"STAC item index {ITEM_INDEX_KEY} was updated by another worker, keeping its version")
+        try:
+            response = s3_client.head_object(Bucket=bucket_name, Key=ITEM_INDEX_KEY)
+        except ClientError as head_error:
+            logger.warning(f"Failed to read STAC item index {ITEM_INDEX_KEY}: {head_error}")
+            response = {}
+    with _ITEM_CACHE_LOCK:
+        _ITEM_INDEX_STATE.update(etag=response.get("ETag"), saved_at=now, dirty=False)
+
+
+def _items_prefix(field_id: str | None, index_type: str | None, datetime_filter: str | None) -> str:
+    """Build the most specific S3 prefix that still contains every matching item.
 
+    Items are stored at catalog/items/{field_id}/{index_name}/{date}.json. Field
+    IDs containing "-" or "/" do not map onto that layout and are not narrowed.
+
+    :param field_id: Field ID filter
+    :param index_type: Index type filter
+    :param datetime_filter: Datetime filter
+    :returns: S3 prefix to list
+    """
+    if not field_id or "-" in field_id or "/" in field_id:
+        return ITEMS_PREFIX
+    prefix = f"{ITEMS_PREFIX}{field_id}/"
+    if not index_type:
+        return prefix
+    prefix = f"{prefix}{index_type.lower()}/"
+    if datetime_filter and DATE_PREFIX_PATTERN.match(datetime_filter):
+        prefix = f"{prefix}{datetime_filter}"
+    return prefix
+
+
+def _list_items(prefix: str = ITEMS_PREFIX) -> list[dict[str, Any]]:
+    """List STAC items under a prefix from S3.
+
+    Items whose ETag matches the cached copy are served from memory; new or
+    modified objects are downloaded concurrently. Cache entries for deleted
+    keys under the prefix are evicted. The first full listing seeds the cache
+    from the persisted index, tried once per process, and later full listings
+    refresh that index once the cache has changed. Snapshots of different prefixes refresh in parallel
+    worker threads, so every access to the shared cache holds _ITEM_CACHE_LOCK.
+
+    :param prefix: S3 prefix to list
     :returns: List of STAC item dictionaries
     """
-    items = []
+    with _ITEM_CACHE_LOCK:
+        load_index = prefix == ITEMS_PREFIX and not _ITEM_INDEX_STATE["loaded"]
+        if load_index:
+            _ITEM_INDEX_STATE["loaded"] = True
+    if load_index:
+        _load_item_index()
+
+    listed: list[tuple[str, str]] = []
     paginator = s3_client.get_paginator("list_objects_v2")
-    page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=ITEMS_PREFIX)
+    page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
 
     for page in page_iterator:
         for obj in page.get("Contents", []):
-            key = obj["Key"]
-            if key.endswith(".json"):
-                try:
-                    item = _load_json_from_s3(key)
-                    items.append(item)
-                except HTTPException:
-                    continue
+            if obj["Key"].endswith(".json"):
+                listed.append((obj["Key"], obj["ETag"]))
+
+    with _ITEM_CACHE_LOCK:
+        stale = [(key, etag) for key, etag in listed if _ITEM_CACHE.get(key, ("", {}))[0] != etag]
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(stale))) as executor:
+            fetched = list(executor.map(_fetch_item, [key for key, _ in stale]))
+        with _ITEM_CACHE_LOCK:
+            for (key, etag), item in zip(stale, fetched):
+                if item is None:
+                    _ITEM_CACHE.pop(key, None)
+                else:
+                    _ITEM_CACHE[key] = (etag, item)
+
+    listed_keys = {key for key, _ in listed}
+    with _ITEM_CACHE_LOCK:
+        evicted = {key for key in _ITEM_CACHE if key.startswith(prefix)} - listed_keys
+        for key in evicted:
+            _ITEM_CACHE.pop(key, None)
+        if stale or evicted:
+            _ITEM_INDEX_STATE["dirty"] = True
+
+    if prefix == ITEMS_PREFIX:
+        _save_item_index()
 
+    items = []
+    with _ITEM_CACHE_LOCK:
+        for key, _ in listed:
+            cached = _ITEM_CACHE.get(key)
+            if cached is not None:
+                items.append(cached[1])
     return items
 
 
-def _apply_filters(
-    items: list[dict[str, Any]],
+def _get_snapshot(prefix: str = ITEMS_PREFIX) -> _ItemSnapshot:
+    """Get snapshot of current STAC items, rebuilding indexes only if items changed.
+
+    Runs in a worker thread, so it only reads _SNAPSHOTS; the caller stores
+    the result on the event loop.
+
+    :param prefix: S3 prefix the snapshot covers
+    :returns: Item snapshot
+    """
+    items = _list_items(prefix)
+    snapshot = _SNAPSHOTS.get(prefix)
+    if (
+        snapshot is None
+        or len(items) != len(snapshot.items)
+        or any(a is not b for a, b in zip(items, snapshot.items))
+    ):
+        snapshot = _ItemSnapshot(items, etag=_catalog_etag(prefix))
+    return snapshot
+
+
+async def _current_snapshot(prefix: str = ITEMS_PREFIX) -> _ItemSnapshot:
+    """Get the shared item snapshot for a prefix, refreshing it once its TTL has expired.
+
+    A fresh snapshot of the whole catalog is used for any prefix. Concurrent
+    requests that find a snapshot expired wait on a single refresh instead of
+    each listing S3. Expired snapshots of other prefixes are dropped, as are
+    the least recently used ones beyond SNAPSHOT_MAX_ENTRIES.
+
+    :param prefix: S3 prefix to list
+    :returns: Item snapshot
+    """
+    now = time.monotonic()
+    for candidate in (ITEMS_PREFIX, prefix):
+        if now < _SNAPSHOT_EXPIRES_AT.get(candidate, 0.0):
+            _SNAPSHOTS.move_to_end(candidate)
+            return _SNAPSHOTS[candidate]
+    async with _SNAPSHOT_LOCKS.setdefault(prefix, asyncio.Lock()):
+        if time.monotonic() < _SNAPSHOT_EXPIRES_AT.get(prefix, 0.0):
+            _SNAPSHOTS.move_to_end(prefix)
+            return _SNAPSHOTS[prefix]
+        snapshot = await asyncio.to_thread(_get_snapshot, prefix)
+        _SNAPSHOTS[prefix] = snapshot
+        _SNAPSHOTS.move_to_end(prefix)
+        now = time.monotonic()
+        _SNAPSHOT_EXPIRES_AT[prefix] = now + SNAPSHOT_TTL_SECONDS
+        for expired in [key for key, expires_at in _SNAPSHOT_EXPIRES_AT.items() if expires_at <= now]:
+            _SNAPSHOT_EXPIRES_AT.pop(expired, None)
+            _SNAPSHOTS.pop(expired, None)
+        while len(_SNAPSHOTS) > SNAPSHOT_MAX_ENTRIES:
+            oldest, _ = _SNAPSHOTS.popitem(last=False)
+            _SNAPSHOT_EXPIRES_AT.pop(oldest, None)
+        return snapshot
+
+
+def _catalog_etag(prefix: str = ITEMS_PREFIX) -> str:
+    """Compute a version tag for cached items under a prefix from their S3 keys and ETags.
+
+    :param prefix: S3 prefix
+    :returns: Hex digest that changes whenever any item is added, modified or removed
+    """
+    with _ITEM_CACHE_LOCK:
+        entries = sorted((key, etag) for key, (etag, _) in _ITEM_CACHE.items() if key.startswith(prefix))
+    digest = hashlib.blake2b(digest_size=16)
+    for key, etag in entries:
+        digest.update(f"{key}\0{etag}\n".encode())
+    return digest.hexdigest()
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header matches an ETag.
+
+    :param request: Incoming request
+    :param etag: ETag of the current representation
+    :returns: True if the client already holds this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _match_indices(
+    snapshot: _ItemSnapshot,
     field_id: str | None = None,
     index_type: str | None = None,
     datetime_filter: str | None = None,
     bbox: list[float] | None = None,
-    limit: int | None = None,
-) -> list[dict[str, Any]]:
-    """Apply filters to STAC items.
+) -> range | list[int]:
+    """Find the snapshot positions of items matching the filters.
+
+    Each enabled filter is answered from one of the snapshot's indexes and
+    the resulting candidate sets are intersected in a single pass, starting
+    from the smallest one.
 
-    :param items: List of STAC items
+    :param snapshot: Item snapshot
     :param field_id: Filter by field ID
     :param index_type: Filter by index type (NDVI, NDMI)
     :param datetime_filter: Filter by datetime
     :param bbox: Filter by bounding box [min_lon, min_lat, max_lon, max_lat]
-    :param limit: Maximum number of items to return
-    :returns: Filtered items
+    :returns: Matching item positions in listing order
     """
-    filtered = items
+    matches: list[set[int]] = []
     if field_id:
-        filtered = [item for item in filtered if item.get("properties", {}).get("field_id") == field_id]
+        matches.append(snapshot.field_id_index.get(field_id, set()))
     if index_type:
-        filtered = [item for item in filtered if item.get("properties", {}).get("index_type") == index_type.upper()]
-    if datetime_filter:
-        filtered = _filter_by_datetime(filtered, datetime_filter)
+        matches.append(snapshot.index_type_index.get(index_type.upper(), set()))
     if bbox and len(bbox) == 4:
-        min_lon, min_lat, max_lon, max_lat = bbox
-        filtered = [
-            item
-            for item in filtered
-            if item.get("bbox")
-            and item["bbox"][0] >= min_lon
-            and item["bbox"][1] >= min_lat
-            and item["bbox"][2] <= max_lon
-            and item["bbox"][3] <= max_lat
-        ]
-    if limit is not None:
-        filtered = filtered[:limit]
-    return filtered
+        matches.append(_filter_by_bbox(snapshot, bbox))
+    if datetime_filter:
+        matches.append(_filter_by_datetime(snapshot, datetime_filter))
+
+    if not matches:
+        return range(len(snapshot.items))
+    matches.sort(key=len)
+    return sorted(matches[0].intersection(*matches[1:]))
+
+
+def _parse_bbox(bbox: str | None) -> list[float] | None:
+    """Parse a bounding box query parameter.
+
+    :param bbox: Comma-separated min_lon,min_lat,max_lon,max_lat, or None
+    :returns: Four floats, or None if no bbox was given
+    :raises HTTPException: If the bbox is malformed
+    """
+    if not bbox:
+        return None
+    try:
+        bbox_values = [float(x) for x in bbox.split(",")]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid bbox format, expected comma-separated floats") from e
+    if len(bbox_values) != 4:
+        raise HTTPException(status_code=400, detail="Invalid bbox, expected four values")
+    return bbox_values
+
+
+def _feature_collection(
+    request: Request,
+    snapshot: _ItemSnapshot,
+    indices: range | list[int],
+    limit: int,
+    offset: int,
+    self_link: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a FeatureCollection page, materialising only the items on it.
+
+    :param request: Incoming request, used to build the next link
+    :param snapshot: Item snapshot
+    :param indices: Positions of all matching items
+    :param limit: Page size
+    :param offset: Number of matching items to skip
+    :param self_link: Self link for the response
+    :returns: FeatureCollection with a next link if more items match; POST
+        next links ask the client to merge the offset into the original body
+    """
+    page = indices[offset : offset + limit]
+    links = [self_link]
+    if offset + limit < len(indices):
+        if self_link.get("method") == "POST":
+            next_link = {**self_link, "rel": "next", "body": {"offset": offset + limit}, "merge": True}
+        else:
+            next_url = request.url.include_query_params(offset=offset + limit)
+            next_link = {**self_link, "rel": "next", "href": f"{next_url.path}?{next_url.query}"}
+        links.append(next_link)
+    return {
+        "type": "FeatureCollection",
+        "features": [snapshot.items[i] for i in page],
+        "numberMatched": len(indices),
+        "numberReturned": len(page),
+        "links": links,
+    }
 
 
 @app.get("/collections/{collection_id}/items")
-def list_collection_items(
+async def list_collection_items(
+    request: Request,
     collection_id: str,
     limit: int = Query(default=10, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0, description="Number of matching items to skip"),
     bbox: str | None = Query(default=None, description="Bounding box: min_lon,min_lat,max_lon,max_lat"),
     datetime: str | None = Query(default=None, description="Date filter (e.g., '2025-01' or '2025-01-01T00:00:00Z/2025-01-31T23:59:59Z')"),
     field_id: str | None = Query(default=None, description="Filter by field ID"),
     index_type: str | None = Query(default=None, description="Filter by index type (NDVI, NDMI)"),
-) -> dict[str, Any]:
+) -> Response:
     """List items in collection with filters.
 
     Essential endpoint for querying field data by field_id, date, index_type, and bounding box.
 
+    Responses carry a weak ETag derived from the catalog version and the
+    query, and conditional requests that still match get a 304.
+
+    :param request: Incoming request
     :param collection_id: Collection ID (must be "field-indices")
     :param limit: Maximum number of items to return
+    :param offset: Number of matching items to skip
     :param bbox: Bounding box filter (comma-separated: min_lon,min_lat,max_lon,max_lat)
     :param datetime: Datetime filter (prefix or ISO 8601 interval)
     :param field_id: Field ID filter
@@ -165,45 +599,46 @@ def list_collection_items(
     if collection_id != COLLECTION_ID:
         raise HTTPException(status_code=404, detail=f"Collection not found: {collection_id}")
 
-    all_items = _list_items()
+    bbox_values = _parse_bbox(bbox)
+    snapshot = await _current_snapshot(_items_prefix(field_id, index_type, datetime))
+    query_digest = hashlib.blake2b(f"{snapshot.etag}?{request.url.query}".encode(), digest_size=16)
+    headers = {"ETag": f'W/"{query_digest.hexdigest()}"', "Cache-Control": CACHE_CONTROL}
+    if _is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
-    bbox_values = None
-    if bbox:
-        try:
-            bbox_values = [float(x) for x in bbox.split(",")]
-            if len(bbox_values) != 4:
-                raise HTTPException(status_code=400, detail="Invalid bbox, expected four values")
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail="Invalid bbox format, expected comma-separated floats") from e
-
-    filtered_items = _apply_filters(
-        all_items,
+    indices = _match_indices(
+        snapshot,
         field_id=field_id,
         index_type=index_type,
         datetime_filter=datetime,
         bbox=bbox_values,
-        limit=limit,
     )
-
-    return {
-        "type": "FeatureCollection",
-        "features": filtered_items,
-        "links": [
-            {"rel": "self", "href": f"/collections/{collection_id}/items", "type": "application/geo+json"},
-        ],
-    }
+    self_link = {"rel": "self", "href": f"/collections/{collection_id}/items", "type": "application/geo+json"}
+    return ORJSONResponse(_feature_collection(request, snapshot, indices, limit, offset, self_link), headers=headers)
 
 
 @app.get("/collections/{collection_id}/items/{item_id}")
-def get_item(collection_id: str, item_id: str) -> dict[str, Any]:
+async def get_item(
+    request: Request,
+    collection_id: str,
+    item_id: str,
+    inline: bool = Query(default=True, description="Return the item body; false redirects to a presigned S3 URL"),
+) -> Any:
     """Get specific item by ID.
 
     Item ID format: {field_id}-{index_name}-{date}
     Example: field-123-ndvi-2025-01-15
 
+    The item body is returned with the S3 ETag and Last-Modified headers
+    passed through. Clients that can reach the S3 endpoint directly may pass
+    inline=false to be redirected to a presigned URL instead; the item's
+    existence is checked first so a missing item is still a 404.
+
+    :param request: Incoming request
     :param collection_id: Collection ID (must be "field-indices")
     :param item_id: Item ID
-    :returns: STAC Item JSON
+    :param inline: Load the item through the API instead of redirecting
+    :returns: STAC Item JSON, or a redirect to it if not inline
     """
     if collection_id != COLLECTION_ID:
         raise HTTPException(status_code=404, detail=f"Collection not found: {collection_id}")
@@ -215,45 +650,85 @@ def get_item(collection_id: str, item_id: str) -> dict[str, Any]:
     field_id, index_name, date_str = parts[0], parts[1], "-".join(parts[2:])
     s3_key = f"{ITEMS_PREFIX}{field_id}/{index_name}/{date_str}.json"
 
+    if not inline:
+        try:
+            await asyncio.to_thread(s3_client.head_object, Bucket=bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                raise HTTPException(status_code=404, detail=f"Item not found: {item_id}") from e
+            raise HTTPException(status_code=500, detail=f"Error loading from S3: {e}") from e
+        url = s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket_name, "Key": s3_key},
+            ExpiresIn=PRESIGNED_URL_EXPIRY_SECONDS,
+        )
+        return RedirectResponse(url, status_code=307)
+
     try:
-        return _load_json_from_s3(s3_key)
+        item, metadata = await asyncio.to_thread(_load_json_with_metadata_from_s3, s3_key)
     except HTTPException as e:
         if e.status_code == 404:
             raise HTTPException(status_code=404, detail=f"Item not found: {item_id}") from e
         raise
 
+    headers = {"Cache-Control": CACHE_CONTROL}
+    if metadata.get("ETag"):
+        headers["ETag"] = metadata["ETag"]
+    if metadata.get("LastModified"):
+        headers["Last-Modified"] = format_datetime(metadata["LastModified"], usegmt=True)
+    if "ETag" in headers and _is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(item, headers=headers)
+
 
 @app.post("/search")
-def search_items(
-    field_id: str | None = None,
-    index_type: str | None = None,
-    datetime: str | None = None,
-    bbox: list[float] | None = None,
-    limit: int = 10,
-) -> dict[str, Any]:
+async def search_items(
+    request: Request,
+    body: SearchBody | None = None,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int | None = Query(default=None, ge=0, description="Number of matching items to skip"),
+    bbox: str | None = Query(default=None, description="Bounding box: min_lon,min_lat,max_lon,max_lat"),
+    datetime: str | None = Query(default=None, description="Datetime filter (prefix or ISO 8601 interval)"),
+    field_id: str | None = Query(default=None, description="Filter by field ID"),
+    index_type: str | None = Query(default=None, description="Filter by index type (NDVI, NDMI)"),
+) -> ORJSONResponse:
     """Search STAC items with filters.
 
-    Alternative to GET endpoint for complex queries with JSON body.
+    Alternative to GET endpoint for complex queries with JSON body. Filters
+    passed as query parameters are still accepted, and fields set in the body
+    take precedence over them. The next link asks clients to resend the
+    original request with the new offset merged into the body.
 
-    :param field_id: Filter by field ID
-    :param index_type: Filter by index type (NDVI, NDMI)
+    :param request: Incoming request
+    :param body: Search filters and paging
+    :param limit: Maximum number of items to return
+    :param offset: Number of matching items to skip
+    :param bbox: Bounding box filter (comma-separated: min_lon,min_lat,max_lon,max_lat)
     :param datetime: Datetime filter (prefix or ISO 8601 interval)
-    :param bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
-    :param limit: Maximum number of items
+    :param field_id: Field ID filter
+    :param index_type: Index type filter (NDVI, NDMI)
     :returns: FeatureCollection with search results
     """
-    all_items = _list_items()
-    filtered_items = _apply_filters(
-        all_items,
-        field_id=field_id,
-        index_type=index_type,
-        datetime_filter=datetime,
-        bbox=bbox,
-        limit=limit,
-    )
-
-    return {
-        "type": "FeatureCollection",
-        "features": filtered_items,
-        "links": [{"rel": "self", "href": "/search", "type": "application/geo+json"}],
+    query = {
+        "field_id": field_id,
+        "index_type": index_type,
+        "datetime": datetime,
+        "bbox": _parse_bbox(bbox),
+        "limit": limit,
+        "offset": offset,
     }
+    fields = {name: value for name, value in query.items() if value is not None}
+    if body is not None:
+        fields.update(body.model_dump(exclude_unset=True))
+    params = SearchBody(**fields)
+    href = f"/search?{request.url.query}" if request.url.query else "/search"
+    self_link = {"rel": "self", "href": href, "type": "application/geo+json", "method": "POST"}
+    snapshot = await _current_snapshot(_items_prefix(params.field_id, params.index_type, params.datetime))
+    indices = _match_indices(
+        snapshot,
+        field_id=params.field_id,
+        index_type=params.index_type,
+        datetime_filter=params.datetime,
+        bbox=params.bbox,
+    )
+    return ORJSONResponse(_feature_collection(request, snapshot, indices, params.limit, params.offset, self_link))
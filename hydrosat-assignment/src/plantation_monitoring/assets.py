@@ -1,7 +1,10 @@
 """Dagster assets for plantation monitoring pipeline."""
 
+import contextlib
+import hashlib
 import os
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from dagster import (
@@ -14,6 +17,7 @@ from dagster import (
     asset,
 )
 from dagster_aws.s3 import S3Resource
+import numpy as np
 from shapely.geometry import mapping, shape
 
 from plantation_monitoring.config.constants import (
@@ -23,6 +27,9 @@ from plantation_monitoring.config.constants import (
     AWS_S3_PIPELINE_STATICDATA_FIELDS_PENDING_KEY,
     AWS_S3_PIPELINE_STATICDATA_FIELDS_PROCESSED_KEY,
     DEFAULT_PARTITION_START_DATE,
+    INDEX_CACHE_DIRNAME,
+    INDEX_CACHE_MAX_BYTES,
+    INDEX_CACHE_VERSION,
     NDMI_BAND_PREFERENCES,
     NDVI_BAND_PREFERENCES,
 )
@@ -327,7 +334,7 @@ def _fetch_sentinel2_data(
 def _prepare_band_urls(
     context: AssetExecutionContext,
     item: dict[str, Any],
-    band_preferences: dict[str, list[str]],
+    band_preferences: dict[str, tuple[str, ...]],
     field: Field,
     index_name: str,
 ) -> tuple[dict[str, str] | None, Output[Field] | None]:
@@ -354,23 +361,95 @@ def _prepare_band_urls(
     return band_urls, None
 
 
+def _index_cache_key(compute_fn: Callable[..., Any], band_urls: dict[str, str], field_geometry: Any) -> str:
+    """Build a content-addressable cache key for a computed index array.
+
+    Query strings are dropped from the band URLs because signed URLs carry
+    a fresh token on every run while pointing at the same COG. The key is
+    salted with INDEX_CACHE_VERSION so changes to the computation invalidate
+    previously cached arrays.
+
+    :param compute_fn: Compute function
+    :param band_urls: Band URL mapping
+    :param field_geometry: Shapely geometry or dict
+    :returns: Hex digest identifying the computation
+    """
+    geometry = field_geometry if hasattr(field_geometry, "wkb") else shape(field_geometry)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{INDEX_CACHE_VERSION}|{compute_fn.__name__}".encode())
+    for band_key, url in sorted(band_urls.items()):
+        digest.update(f"|{band_key}={url.split('?', 1)[0]}".encode())
+    digest.update(geometry.wkb)
+    return digest.hexdigest()
+
+
+def _prune_index_cache(cache_dir: Path, max_bytes: int = INDEX_CACHE_MAX_BYTES) -> None:
+    """Evict the least recently used cached index arrays beyond a size budget.
+
+    :param cache_dir: Directory holding cached ``.npy`` arrays
+    :param max_bytes: Total size to keep
+    """
+    entries = []
+    for path in cache_dir.glob("*.npy"):
+        with contextlib.suppress(FileNotFoundError):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort(reverse=True)
+    total = 0
+    for _, size, path in entries:
+        total += size
+        if total > max_bytes:
+            path.unlink(missing_ok=True)
+
+
 def _compute_index_array(
     compute_fn: Callable[..., Any],
     band_urls: dict[str, str],
     field_geometry: Any,
+    cache_dir: str | None = None,
 ) -> Any:
     """Compute spectral index array from band URLs.
 
+    When ``cache_dir`` is given, results are cached on disk so re-materializing
+    the same field and scene skips the COG reads entirely. Unreadable cache
+    entries are discarded and recomputed, and the cache is kept within
+    INDEX_CACHE_MAX_BYTES by evicting the least recently used arrays.
+
     :param compute_fn: Compute function
     :param band_urls: Band URL mapping
     :param field_geometry: Shapely geometry or dict
+    :param cache_dir: Directory for cached index arrays, or None to disable caching
     :returns: Computed index array
     """
+    cache_path = None
+    if cache_dir:
+        cache_key = _index_cache_key(compute_fn, band_urls, field_geometry)
+        cache_path = Path(cache_dir) / INDEX_CACHE_DIRNAME / f"{cache_key}.npy"
+        try:
+            cached = np.load(cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, EOFError):
+            cache_path.unlink(missing_ok=True)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(cache_path)
+            return cached
+
     compute_kwargs: dict[str, Any] = {}
     for band_key, url in band_urls.items():
         compute_kwargs[f"{band_key}_url"] = url
     compute_kwargs["bbox_geom"] = field_geometry
-    return compute_fn(**compute_kwargs)
+    index_array = compute_fn(**compute_kwargs)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with partial_path.open("wb") as fh:
+            np.save(fh, np.asarray(index_array))
+        os.replace(partial_path, cache_path)
+        _prune_index_cache(cache_path.parent)
+    return index_array
 
 
 def _save_and_publish_results(
@@ -439,7 +518,7 @@ def _materialize_spectral_index(
     bbox: Bbox,
     fields: list[Field],
     index_name: str,
-    band_preferences: dict[str, list[str]],
+    band_preferences: dict[str, tuple[str, ...]],
     compute_fn: Callable[..., Any],
     index_model_class: type,
 ) -> Output[Field]:
@@ -476,12 +555,12 @@ def _materialize_spectral_index(
         f"on date {date_str}"
     )
 
-    field_shape = shape(field.geom)
+    field_shape = field.shapely_geom
     bbox_shape = shape(bbox.geom)
     field_intersection = field_shape.intersection(bbox_shape)
     field_geometry_dict = mapping(field_intersection)
 
-    stac_client = stac.create_client()
+    stac_client = stac.get_client()
     s3_client = s3.get_client()
 
     cloud_cover_threshold = settings.get_cloud_cover_threshold()
@@ -499,7 +578,9 @@ def _materialize_spectral_index(
 
     assert band_urls is not None, "Unexpected: band_urls is None after successful preparation"
 
-    index_array = _compute_index_array(compute_fn, band_urls, field_intersection)
+    index_array = _compute_index_array(
+        compute_fn, band_urls, field_intersection, cache_dir=settings.get_tmp_dir()
+    )
     context.log.info(f"{index_name.upper()} for {field_id} on {date_str} computed.")
 
     field_with_index = field.model_copy(
@@ -11,12 +11,21 @@ AWS_S3_PIPELINE_STATICDATA_BBOX_PENDING_KEY = "raw_catalog/bbox/staging"
 AWS_S3_PIPELINE_STATICDATA_BBOX_PROCESSED_KEY = "raw_catalog/bbox/processed"
 AWS_S3_PIPELINE_STATICDATA_BBOX_FALLBACK_KEY = "raw_catalog/config/bbox.geojson"
 
-NDVI_BAND_PREFERENCES: dict[str, list[str]] = {
-    "red": ["B04", "red", "visual", "B04_visual"],
-    "nir": ["B08", "nir", "B08_visual"],
+INDEX_CACHE_DIRNAME = "index-cache"
+# Bump INDEX_CACHE_VERSION whenever index computation changes, so arrays cached by older code are not reused.
+INDEX_CACHE_VERSION = 1
+INDEX_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Spectral index arrays are stored as int16 scaled by 10000; -32768 marks NaN pixels.
+INDEX_INT16_SCALE = 10000
+INDEX_INT16_NODATA = -32768
+
+NDVI_BAND_PREFERENCES: dict[str, tuple[str, ...]] = {
+    "red": ("B04", "red", "visual", "B04_visual"),
+    "nir": ("B08", "nir", "B08_visual"),
 }
 
-NDMI_BAND_PREFERENCES: dict[str, list[str]] = {
-    "nir": ["B08", "nir", "B08_visual"],
-    "swir": ["B11", "swir16", "B12", "swir"],
+NDMI_BAND_PREFERENCES: dict[str, tuple[str, ...]] = {
+    "nir": ("B08", "nir", "B08_visual"),
+    "swir": ("B11", "swir16", "B12", "swir"),
 }
@@ -1,22 +1,72 @@
 """S3 client connector for MinIO operations."""
 
+import io
 import os
 from typing import Any
 
 import boto3
-from dagster import ConfigurableResource
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from dagster import ConfigurableResource, InitResourceContext
+from pydantic import PrivateAttr
 
 from plantation_monitoring.connectors.settings import SettingsResource
 
+S3_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+
+SINGLE_PUT_MAX_BYTES = 256 * 1024
+UPLOAD_TRANSFER_CONFIG = TransferConfig(multipart_threshold=64 * 1024 * 1024, use_threads=False)
+
+
+def upload_bytes(
+    s3_client: Any, bucket_name: str, s3_key: str, body: bytes | io.BytesIO, content_type: str
+) -> None:
+    """Upload an in-memory payload to S3.
+
+    Small payloads go out as a single PutObject; the managed transfer is only
+    used above SINGLE_PUT_MAX_BYTES, and without its worker thread pool.
+    A BytesIO body is uploaded from its buffer without copying it to bytes.
+
+    :param s3_client: S3 client
+    :param bucket_name: S3 bucket name
+    :param s3_key: S3 key
+    :param body: Payload bytes, or a BytesIO holding them
+    :param content_type: Content type of the payload
+    """
+    if isinstance(body, io.BytesIO):
+        body.seek(0)
+        size = body.getbuffer().nbytes
+    else:
+        size = len(body)
+    if size < SINGLE_PUT_MAX_BYTES:
+        s3_client.put_object(Bucket=bucket_name, Key=s3_key, Body=body, ContentType=content_type)
+        return
+    s3_client.upload_fileobj(
+        body if isinstance(body, io.BytesIO) else io.BytesIO(body),
+        Bucket=bucket_name,
+        Key=s3_key,
+        ExtraArgs={"ContentType": content_type},
+        Config=UPLOAD_TRANSFER_CONFIG,
+    )
+
 
 class S3Resource(ConfigurableResource[Any]):
     """S3 resource for creating boto3 S3 clients."""
 
     settings: SettingsResource
 
+    _client: Any | None = PrivateAttr(default=None)
+
     def create_client(self) -> Any:
         """Create S3 client.
 
+        The client keeps TCP connections alive and pools enough of them for
+        the concurrent fetch and copy paths, with adaptive retries.
+
         :returns: Configured S3 client
         """
         aws_access_key_id = os.environ.get("AWS_ACCESS_KEY_ID") or os.environ.get("MINIO_ROOT_USER")
@@ -29,11 +79,26 @@ class S3Resource(ConfigurableResource[Any]):
             aws_secret_access_key=aws_secret_access_key,
             region_name=self.settings.aws_region,
             use_ssl=self.settings.aws_s3_use_ssl,
+            config=S3_CLIENT_CONFIG,
         )
 
     def get_client(self) -> Any:
         """Get S3 client instance.
 
+        The client is created on first use and reused afterwards; boto3
+        clients are thread-safe, so a single instance can be shared.
+
         :returns: Configured S3 client
         """
-        return self.create_client()
+        if self._client is None:
+            self._client = self.create_client()
+        return self._client
+
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        """Close the cached S3 client and its connection pool.
+
+        :param context: Resource context
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -1,10 +1,13 @@
 """Settings resource for managing configuration from environment variables."""
 
 import os
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union, get_args, get_origin, get_type_hints
+from typing import Any, get_args
 
 from dagster import ConfigurableResource, EnvVar
+from pydantic import PrivateAttr
 
 from plantation_monitoring.config.constants import (
     DEFAULT_CLOUD_COVER_THRESHOLD,
@@ -12,6 +15,63 @@ from plantation_monitoring.config.constants import (
     DEFAULT_TMP_DIR,
 )
 
+TRUTHY_VALUES = frozenset({"true", "1", "yes", "y", "on"})
+ENV_DEFAULTS: dict[str, Any] = {
+    "aws_s3_use_ssl": False,
+    "tmp_dir": DEFAULT_TMP_DIR,
+    "partition_start_date": DEFAULT_PARTITION_START_DATE,
+    "cloud_cover_threshold": DEFAULT_CLOUD_COVER_THRESHOLD,
+}
+
+
+def _to_bool(raw: str) -> bool:
+    """Interpret environment variable value as boolean.
+
+    :param raw: Raw environment variable value
+    :returns: True if the value is a recognised truthy string
+    """
+    return raw.strip().lower() in TRUTHY_VALUES
+
+
+def _to_int(raw: str) -> int | None:
+    """Interpret environment variable value as integer.
+
+    :param raw: Raw environment variable value
+    :returns: Integer value or None if empty
+    """
+    return int(raw) if raw else None
+
+
+@lru_cache(maxsize=1)
+def _settings_schema() -> tuple[tuple[str, str, Callable[[str], Any], Any], ...]:
+    """Build the table used to populate SettingsResource from the environment.
+
+    :returns: Tuples of (attr_name, env_var_name, coercer, default)
+    """
+    coercers: dict[Any, Callable[[str], Any]] = {bool: _to_bool, int: _to_int}
+    return tuple(
+        (attr_name, attr_name.upper(), coercers.get(field.annotation, str), ENV_DEFAULTS.get(attr_name))
+        for attr_name, field in SettingsResource.model_fields.items()
+    )
+
+
+@lru_cache(maxsize=1)
+def _required_settings() -> tuple[str, ...]:
+    """Find the settings that must resolve to a value.
+
+    A setting is required when its declared default is an EnvVar, i.e. it has
+    no plain default, and its annotation does not allow None.
+
+    :returns: Sorted attribute names of required settings
+    """
+    return tuple(
+        sorted(
+            attr_name
+            for attr_name, field in SettingsResource.model_fields.items()
+            if isinstance(field.default, EnvVar) and type(None) not in get_args(field.annotation)
+        )
+    )
+
 
 class SettingsResource(ConfigurableResource[Any]):
     """Settings resource using EnvVar for runtime resolution in Dagster."""
@@ -25,6 +85,8 @@ class SettingsResource(ConfigurableResource[Any]):
     partition_start_date: str = EnvVar("DAGSTER_PARTITION_START_DATE")
     cloud_cover_threshold: int = EnvVar("CLOUD_COVER_THRESHOLD")  # type: ignore[assignment]
 
+    _resolved: dict[str, Any] = PrivateAttr(default_factory=dict)
+
     @staticmethod
     def create(swallow_errors: bool = False) -> "SettingsResource":
         """Create SettingsResource from environment variables.
@@ -33,23 +95,9 @@ class SettingsResource(ConfigurableResource[Any]):
         :returns: SettingsResource instance
         """
         env_values: dict[str, Any] = {}
-        for attr_name, attr_type in get_type_hints(SettingsResource).items():
-            raw = os.environ.get(attr_name.upper())
-            if raw is None:
-                if attr_name == "tmp_dir":
-                    env_values[attr_name] = DEFAULT_TMP_DIR
-                elif attr_name == "partition_start_date":
-                    env_values[attr_name] = DEFAULT_PARTITION_START_DATE
-                elif attr_name == "cloud_cover_threshold":
-                    env_values[attr_name] = DEFAULT_CLOUD_COVER_THRESHOLD
-                else:
-                    env_values[attr_name] = None
-            elif attr_type is bool:
-                env_values[attr_name] = raw.strip().lower() in ("true", "1", "yes", "y", "on")
-            elif attr_type is int:
-                env_values[attr_name] = int(raw) if raw else None
-            else:
-                env_values[attr_name] = raw
+        for attr_name, env_var_name, coerce, default in _settings_schema():
+            raw = os.environ.get(env_var_name)
+            env_values[attr_name] = default if raw is None else coerce(raw)
 
         settings = SettingsResource(**env_values)
         try:
@@ -59,37 +107,52 @@ class SettingsResource(ConfigurableResource[Any]):
                 raise
         return settings
 
+    def _resolve(self, attr_name: str) -> Any:
+        """Get setting value, resolving and memoizing EnvVar values.
+
+        :param attr_name: Setting attribute name
+        :returns: Resolved value or None
+        """
+        if attr_name not in self._resolved:
+            value = getattr(self, attr_name, None)
+            self._resolved[attr_name] = value.get_value() if isinstance(value, EnvVar) else value
+        return self._resolved[attr_name]
+
     def create_tmp_dir(self) -> None:
         """Create temporary directory if missing."""
-        tmp_dir_value = self.tmp_dir.get_value() if isinstance(self.tmp_dir, EnvVar) else self.tmp_dir
+        tmp_dir_value = self._resolve("tmp_dir")
         if tmp_dir_value:
             Path(tmp_dir_value).mkdir(parents=True, exist_ok=True)
 
+    def get_tmp_dir(self) -> str | None:
+        """Get temporary directory path, resolving EnvVar if needed.
+
+        :returns: Temporary directory path, or None if unset
+        """
+        return self._resolve("tmp_dir") or None
+
     def get_cloud_cover_threshold(self) -> int:
         """Get cloud cover threshold, resolving EnvVar if needed.
 
         :returns: Cloud cover threshold as integer
         """
-        threshold = self.cloud_cover_threshold
-        if isinstance(threshold, EnvVar):
-            value = threshold.get_value()
-            return int(value) if value else DEFAULT_CLOUD_COVER_THRESHOLD
-        if threshold is None:
+        threshold = self._resolve("cloud_cover_threshold")
+        if threshold is None or threshold == "":
             return DEFAULT_CLOUD_COVER_THRESHOLD
         return int(threshold)
 
     def validate_settings(self) -> None:
         """Validate all required settings are present."""
         missing_vars = []
-        for attr_name, attr_type in get_type_hints(self.__class__).items():
-            attr_value = getattr(self, attr_name, None)
-            if isinstance(attr_value, EnvVar):
-                is_optional = get_origin(attr_type) is Union and type(None) in get_args(attr_type)
-                if not is_optional and attr_value.get_value() is None:
-                    missing_vars.append(attr_value.env_var_name)
+        for attr_name in _required_settings():
+            attr_value = getattr(self, attr_name)
+            if isinstance(attr_value, EnvVar) and self._resolve(attr_name) is None:
+                missing_vars.append(attr_value.env_var_name)
         if missing_vars:
             raise ValueError(f"Missing mandatory environment variables: {', '.join(missing_vars)}")
 
     def _post_init(self) -> None:
+        for attr_name, *_ in _settings_schema():
+            self._resolve(attr_name)
         self.create_tmp_dir()
         self.validate_settings()
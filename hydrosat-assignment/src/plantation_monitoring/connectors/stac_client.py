@@ -3,6 +3,7 @@
 from typing import Any
 
 from dagster import ConfigurableResource
+from pydantic import PrivateAttr
 from pystac_client import Client
 
 from plantation_monitoring.connectors.settings import SettingsResource
@@ -13,9 +14,23 @@ class STACResource(ConfigurableResource[Any]):
 
     settings: SettingsResource
 
+    _client: Any | None = PrivateAttr(default=None)
+
     def create_client(self) -> Any:
         """Create STAC client.
 
         :returns: Configured STAC client
         """
         return Client.open(self.settings.stac_api_url)
+
+    def get_client(self) -> Any:
+        """Get STAC client instance.
+
+        The client is opened on first use and reused afterwards, so the
+        landing page is only fetched once per resource.
+
+        :returns: Configured STAC client
+        """
+        if self._client is None:
+            self._client = self.create_client()
+        return self._client
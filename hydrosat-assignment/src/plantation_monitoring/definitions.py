@@ -1,6 +1,14 @@
-"""Dagster definitions for the plantation monitoring pipeline."""
+"""Dagster definitions for the plantation monitoring pipeline.
+
+Definitions are built lazily so that importing this module (UI, CLI and
+sensor daemons import it often) does not resolve settings or collect assets
+until Dagster actually loads the code location.
+"""
+
+from functools import cache
 
 from dagster import Definitions, load_assets_from_modules
+from dagster.components import definitions
 
 from plantation_monitoring import assets  # noqa: TID252
 from plantation_monitoring.connectors.s3_client import S3Resource
@@ -10,21 +18,24 @@ from plantation_monitoring.storage import create_s3_io_manager
 from plantation_monitoring.triggers.jobs import bbox_job, fields_job
 from plantation_monitoring.triggers.s3_file_sensor import s3_bbox_sensor, s3_fields_sensor
 
-all_assets = load_assets_from_modules([assets])
 
-settings = SettingsResource.create(swallow_errors=True)
-s3 = S3Resource(settings=settings)
+@definitions
+@cache
+def defs() -> Definitions:
+    """Build the pipeline definitions once per process.
 
-s3_io_manager = create_s3_io_manager(settings)
+    :returns: Definitions with assets, jobs, sensors and resources
+    """
+    settings = SettingsResource.create(swallow_errors=True)
 
-defs = Definitions(
-    assets=all_assets,
-    jobs=[fields_job, bbox_job],
-    sensors=[s3_fields_sensor, s3_bbox_sensor],
-    resources={
-        "s3": s3,
-        "stac": STACResource(settings=settings),
-        "settings": settings,
-        "io_manager": s3_io_manager,
-    },
-)
+    return Definitions(
+        assets=load_assets_from_modules([assets]),
+        jobs=[fields_job, bbox_job],
+        sensors=[s3_fields_sensor, s3_bbox_sensor],
+        resources={
+            "s3": S3Resource(settings=settings),
+            "stac": STACResource(settings=settings),
+            "settings": settings,
+            "io_manager": create_s3_io_manager(settings),
+        },
+    )
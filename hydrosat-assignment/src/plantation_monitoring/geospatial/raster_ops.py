@@ -1,16 +1,32 @@
 """Geospatial and raster operations for spectral index computation."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 import rasterio
 import rasterio.warp
+import shapely
 from numpy.typing import NDArray
+from pyproj import Transformer
 from rasterio.enums import Resampling
-from rasterio.mask import geometry_mask
-from rasterio.windows import from_bounds
+from rasterio.mask import geometry_mask, mask as rio_mask
+from rasterio.windows import Window
 from shapely.geometry import mapping, shape
 
+_SHAPE_CACHE_LOCK = threading.Lock()
+
+# GDAL options for reading remote COGs: skip the sidecar directory listing
+# on open and coalesce adjacent tile range requests into a single HTTP read.
+# The block cache size is deliberately not set here, so GDAL reads it from the
+# GDAL_CACHEMAX environment variable (e.g. "10%" or a size in MB), sized per pod.
+COG_READ_OPTIONS: dict[str, str] = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+}
+
 
 def _get_geom_dict(bbox_geom: dict[str, Any] | None) -> dict[str, Any] | None:
     """Convert geometry to dictionary format.
@@ -63,38 +79,175 @@ def resample_band_to_match(
     )
 
     if bbox_transformed_shape is not None:
-        mask = geometry_mask(
+        outside = geometry_mask(
             [bbox_transformed_shape],
             transform=target_transform,
-            invert=True,
             out_shape=target_shape,
         )
-        dst_data[~mask] = np.nan
+        np.copyto(dst_data, np.float32(np.nan), where=outside)
 
     return dst_data
 
 
+@lru_cache(maxsize=32)
+def _transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Build a CRS transformer once per CRS pair.
+
+    :param src_crs: Source CRS
+    :param dst_crs: Destination CRS
+    :returns: Transformer with x/y (lon/lat) axis order
+    """
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def _transformed_shape(
+    geom_dict: dict[str, Any], geom_crs: str, dst_crs: Any, shape_cache: dict[str, Any] | None = None
+) -> Any:
+    """Transform geometry to raster CRS as a shapely shape.
+
+    :param geom_dict: Geometry dictionary
+    :param geom_crs: Geometry CRS
+    :param dst_crs: Raster CRS
+    :param shape_cache: Optional cache of shapes keyed by raster CRS, shared between band
+        reader threads; lookups are serialised so concurrent readers transform only once
+    :returns: Shapely geometry in raster CRS
+    """
+    key = str(dst_crs)
+    if shape_cache is None:
+        return shapely.transform(shape(geom_dict), _transformer(geom_crs, key).transform, interleaved=False)
+    with _SHAPE_CACHE_LOCK:
+        if key not in shape_cache:
+            shape_cache[key] = shapely.transform(
+                shape(geom_dict), _transformer(geom_crs, key).transform, interleaved=False
+            )
+        return shape_cache[key]
+
+
+def _read_pixel(src: Any, point: Any) -> tuple[np.ma.MaskedArray, Any]:
+    """Read the single pixel containing a point.
+
+    Matches what rasterio.mask returns for a point geometry without
+    rasterizing a mask.
+
+    :param src: Raster source
+    :param point: Shapely point in raster CRS
+    :returns: Tuple of (1x1 masked data, window transform)
+    """
+    row, col = src.index(point.x, point.y)
+    if not (0 <= row < src.height and 0 <= col < src.width):
+        raise ValueError("Input shapes do not overlap raster.")
+    window = Window(col, row, 1, 1)
+    return src.read(1, window=window, masked=True), src.window_transform(window)
+
+
 def _read_and_mask_band(
-    src: Any, geom_dict: dict[str, Any] | None, geom_crs: str
-) -> tuple[NDArray[np.floating], Any, Any]:
+    src: Any, geom_dict: dict[str, Any] | None, geom_crs: str, shape_cache: dict[str, Any] | None = None
+) -> tuple[np.ma.MaskedArray, Any, Any]:
     """Read and mask band from raster source.
 
+    Data keeps the raster's native dtype (uint16 for Sentinel-2 reflectance);
+    pixels outside the geometry or equal to the raster's nodata value are
+    masked rather than overwritten. Cropping and masking happen in a single
+    rasterio.mask pass, which reads an integer pixel window rounded outwards
+    from the geometry bounds. Point geometries read their single pixel
+    directly.
+
     :param src: Raster source
     :param geom_dict: Geometry dictionary or None
     :param geom_crs: Geometry CRS
-    :returns: Tuple of (data, transform, bbox_shape)
+    :param shape_cache: Optional cache of transformed shapes keyed by raster CRS
+    :returns: Tuple of (masked data, transform, bbox_shape)
     """
     if geom_dict:
-        bbox_transformed = rasterio.warp.transform_geom(src_crs=geom_crs, dst_crs=src.crs, geom=geom_dict)
-        bbox_shape = shape(bbox_transformed)
-        window = from_bounds(*bbox_shape.bounds, transform=src.transform)
-        data = src.read(1, window=window).astype("float32")
-        window_transform = src.window_transform(window)
-        mask = geometry_mask([bbox_shape], transform=window_transform, invert=True, out_shape=data.shape)
-        data[~mask] = np.nan
+        bbox_shape = _transformed_shape(geom_dict, geom_crs, src.crs, shape_cache)
+        if bbox_shape.geom_type == "Point":
+            data, window_transform = _read_pixel(src, bbox_shape)
+            return data, window_transform, bbox_shape
+        data, window_transform = rio_mask(src, [bbox_shape], crop=True, indexes=1, filled=False)
         return data, window_transform, bbox_shape
-    data = src.read(1).astype("float32")
-    return data, src.transform, None
+    return np.ma.MaskedArray(src.read(1)), src.transform, None
+
+
+def _to_float32(band: NDArray[Any] | np.ma.MaskedArray) -> NDArray[np.float32]:
+    """Cast band to a new float32 array with masked pixels set to NaN.
+
+    :param band: Band array, optionally masked
+    :returns: Float32 array owned by the caller
+    """
+    return np.ma.filled(band.astype(np.float32), np.nan)
+
+
+def _read_band(
+    url: str, geom_dict: dict[str, Any] | None, geom_crs: str, shape_cache: dict[str, Any] | None = None
+) -> tuple[np.ma.MaskedArray, Any, Any, Any]:
+    """Open COG and read band masked to geometry.
+
+    :param url: Band COG URL
+    :param geom_dict: Geometry dictionary or None
+    :param geom_crs: Geometry CRS
+    :param shape_cache: Optional cache of transformed shapes keyed by raster CRS
+    :returns: Tuple of (data, transform, bbox_shape, crs)
+    """
+    with rasterio.Env(**COG_READ_OPTIONS), rasterio.open(url) as src:
+        data, transform, bbox_shape = _read_and_mask_band(src, geom_dict, geom_crs, shape_cache)
+        return data, transform, bbox_shape, src.crs
+
+
+def _read_bands(
+    urls: list[str], geom_dict: dict[str, Any] | None, geom_crs: str
+) -> list[tuple[np.ma.MaskedArray, Any, Any, Any]]:
+    """Read several bands concurrently.
+
+    Band reads are dominated by blocking HTTP range requests, so running them
+    on threads makes latency the slowest read rather than the sum. Bands in
+    the same CRS (all bands of a Sentinel-2 tile) share one geometry transform.
+
+    :param urls: Band COG URLs
+    :param geom_dict: Geometry dictionary or None
+    :param geom_crs: Geometry CRS
+    :returns: List of (data, transform, bbox_shape, crs) in URL order
+    """
+    shape_cache: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(lambda url: _read_band(url, geom_dict, geom_crs, shape_cache), urls))
+
+
+def read_band_window(
+    url: str, bbox_geom: dict[str, Any] | None = None, geom_crs: str = "EPSG:4326"
+) -> NDArray[np.floating]:
+    """Read band window covering geometry, with pixels outside it set to NaN.
+
+    :param url: Band COG URL
+    :param bbox_geom: Optional bbox geometry
+    :param geom_crs: Geometry CRS
+    :returns: Band array
+    """
+    return _to_float32(_read_band(url, _get_geom_dict(bbox_geom), geom_crs)[0])
+
+
+def _normalized_difference(
+    a: NDArray[Any] | np.ma.MaskedArray, b: NDArray[Any] | np.ma.MaskedArray
+) -> NDArray[np.floating]:
+    """Compute (a - b) / (a + b) in float32.
+
+    Bands are only cast to float32 here; masked pixels become NaN. The cast
+    copy of the first band is reused for the result. Pixels whose band sum
+    is not positive (e.g. both bands zero) have no defined index and are
+    set to NaN rather than divided.
+
+    :param a: First band array, optionally masked
+    :param b: Second band array, optionally masked
+    :returns: Normalized difference array
+    """
+    result = _to_float32(a)
+    b = _to_float32(b)
+    denominator = np.add(result, b)
+    valid = denominator > 0
+    np.subtract(result, b, out=result)
+    np.divide(result, denominator, out=result, where=valid)
+    np.logical_not(valid, out=valid)
+    np.copyto(result, np.float32(np.nan), where=valid)
+    return result
 
 
 def compute_ndvi_from_cog_urls(
@@ -102,7 +255,8 @@ def compute_ndvi_from_cog_urls(
 ) -> NDArray[np.floating]:
     """Compute NDVI from red and NIR bands.
 
-    Resamples red to match NIR grid if shapes differ.
+    Resamples red to match NIR grid if shapes differ. The resampled band is not
+    re-masked, since the NIR mask already covers the same pixels.
 
     :param red_url: Red band COG URL
     :param nir_url: NIR band COG URL
@@ -112,23 +266,21 @@ def compute_ndvi_from_cog_urls(
     """
     geom_dict = _get_geom_dict(bbox_geom)
 
-    with rasterio.open(red_url) as red_src, rasterio.open(nir_url) as nir_src:
-        red_data, red_transform, red_shape = _read_and_mask_band(red_src, geom_dict, geom_crs)
-        nir_data, nir_transform, nir_shape = _read_and_mask_band(nir_src, geom_dict, geom_crs)
-
-        if red_data.shape != nir_data.shape:
-            red_data = resample_band_to_match(
-                source_data=red_data,
-                source_transform=red_transform,
-                source_crs=red_src.crs,
-                target_shape=nir_data.shape,
-                target_transform=nir_transform,
-                target_crs=nir_src.crs,
-                bbox_transformed_shape=nir_shape,
-            )
+    (red_data, red_transform, _, red_crs), (nir_data, nir_transform, _, nir_crs) = _read_bands(
+        [red_url, nir_url], geom_dict, geom_crs
+    )
+
+    if red_data.shape != nir_data.shape:
+        red_data = resample_band_to_match(
+            source_data=_to_float32(red_data),
+            source_transform=red_transform,
+            source_crs=red_crs,
+            target_shape=nir_data.shape,
+            target_transform=nir_transform,
+            target_crs=nir_crs,
+        )
 
-    ndvi: NDArray[np.floating] = (nir_data - red_data) / (nir_data + red_data + 1e-6)
-    return ndvi
+    return _normalized_difference(nir_data, red_data)
 
 
 def compute_ndmi_from_cog_urls(
@@ -136,7 +288,8 @@ def compute_ndmi_from_cog_urls(
 ) -> NDArray[np.floating]:
     """Compute NDMI from NIR and SWIR bands.
 
-    Resamples SWIR to match NIR grid if resolutions differ.
+    Resamples SWIR to match NIR grid if resolutions differ. The resampled band is not
+    re-masked, since the NIR mask already covers the same pixels.
 
     :param nir_url: NIR band COG URL
     :param swir_url: SWIR band COG URL
@@ -146,20 +299,18 @@ def compute_ndmi_from_cog_urls(
     """
     geom_dict = _get_geom_dict(bbox_geom)
 
-    with rasterio.open(nir_url) as nir_src, rasterio.open(swir_url) as swir_src:
-        nir_data, nir_transform, nir_shape = _read_and_mask_band(nir_src, geom_dict, geom_crs)
-        swir_data, swir_transform, _ = _read_and_mask_band(swir_src, geom_dict, geom_crs)
-
-        if nir_data.shape != swir_data.shape:
-            swir_data = resample_band_to_match(
-                source_data=swir_data,
-                source_transform=swir_transform,
-                source_crs=swir_src.crs,
-                target_shape=nir_data.shape,
-                target_transform=nir_transform,
-                target_crs=nir_src.crs,
-                bbox_transformed_shape=nir_shape,
-            )
+    (nir_data, nir_transform, _, nir_crs), (swir_data, swir_transform, _, swir_crs) = _read_bands(
+        [nir_url, swir_url], geom_dict, geom_crs
+    )
+
+    if nir_data.shape != swir_data.shape:
+        swir_data = resample_band_to_match(
+            source_data=_to_float32(swir_data),
+            source_transform=swir_transform,
+            source_crs=swir_crs,
+            target_shape=nir_data.shape,
+            target_transform=nir_transform,
+            target_crs=nir_crs,
+        )
 
-    ndmi: NDArray[np.floating] = (nir_data - swir_data) / (nir_data + swir_data + 1e-6)
-    return ndmi
+    return _normalized_difference(nir_data, swir_data)
@@ -1,5 +1,6 @@
 """STAC operations for searching and accessing satellite imagery."""
 
+from functools import lru_cache
 from typing import Any
 
 from dagster import AssetExecutionContext, OpExecutionContext
@@ -43,26 +44,47 @@ def search_first_sentinel_item(
     return item, available_assets
 
 
+@lru_cache(maxsize=256)
+def _resolve_band_keys(
+    band_preferences: tuple[tuple[str, tuple[str, ...]], ...],
+    available_assets: frozenset[str],
+) -> tuple[tuple[tuple[str, str], ...], tuple[str, ...]]:
+    """Resolve which asset key to use for each band label.
+
+    :param band_preferences: Frozen band preference mapping as (label, candidates) pairs
+    :param available_assets: Asset keys present on the item
+    :returns: Tuple of ((label, asset_key) pairs, missing labels)
+    """
+    resolved = []
+    missing = []
+    for label, candidates in band_preferences:
+        for asset_key in candidates:
+            if asset_key in available_assets:
+                resolved.append((label, asset_key))
+                break
+        else:
+            missing.append(label)
+    return tuple(resolved), tuple(missing)
+
+
 def select_and_sign_band_urls(
     item: Any,
-    band_preferences: dict[str, list[str]],
+    band_preferences: dict[str, tuple[str, ...]],
 ) -> tuple[dict[str, str] | None, list[str], list[str]]:
     """Select and sign band URLs based on preferences.
 
+    Asset selection is cached per preference mapping and asset set, so only
+    signing is done per item.
+
     :param item: STAC item
     :param band_preferences: Band preference mapping
     :returns: Tuple of (signed_urls or None, available_assets, missing_labels)
     """
     available_assets = list(item.assets.keys())
-    signed_urls = {}
-    missing = []
-
-    for label, candidates in band_preferences.items():
-        for asset_key in candidates:
-            if asset_key in item.assets:
-                signed_urls[label] = sign(item.assets[asset_key].href)
-                break
-        else:
-            missing.append(label)
+    frozen_preferences = tuple((label, tuple(candidates)) for label, candidates in band_preferences.items())
+    resolved, missing = _resolve_band_keys(frozen_preferences, frozenset(available_assets))
 
-    return (None, available_assets, missing) if missing else (signed_urls, available_assets, missing)
+    if missing:
+        return None, available_assets, list(missing)
+    signed_urls = {label: sign(item.assets[asset_key].href) for label, asset_key in resolved}
+    return signed_urls, available_assets, []
@@ -1,19 +1,60 @@
 """Helper functions to publish NDVI and NDMI results to STAC catalog."""
 
+import hashlib
 import io
-import json
 from datetime import datetime
 from typing import Any
 
-import geopandas as gpd
+import numpy as np
+import orjson
+import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
 from dagster import AssetExecutionContext, OpExecutionContext
 from dagster_aws.s3 import S3Resource
-from shapely.geometry import shape
+from shapely import wkb
+from shapely.geometry import mapping, shape
 
 from plantation_monitoring.connectors.settings import SettingsResource
 from plantation_monitoring.models.models import Field
 
+_catalog_ensured: set[str] = set()
+_published_items: dict[str, str] = {}
+
+# S3 user metadata key holding the BLAKE2b digest of a published STAC item's JSON
+STAC_DIGEST_METADATA_KEY = "content-blake2b"
+
+
+def _dumps(obj: dict[str, Any]) -> bytes:
+    """Serialize a STAC object to JSON bytes with sorted keys.
+
+    Sorted keys make the bytes for a given item deterministic; NumPy
+    scalars and arrays in statistics are serialized natively.
+
+    :param obj: STAC object dictionary
+    :returns: UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _geojson_bounds(geom: dict[str, Any]) -> list[float]:
+    """Compute the bounding box of a GeoJSON geometry.
+
+    Polygons and MultiPolygons are bounded straight from their exterior
+    rings; other geometry types go through shapely.
+
+    :param geom: GeoJSON geometry dictionary
+    :returns: Bounding box as [minx, miny, maxx, maxy]
+    """
+    if geom["type"] == "Polygon":
+        rings = [geom["coordinates"][0]]
+    elif geom["type"] == "MultiPolygon":
+        rings = [polygon[0] for polygon in geom["coordinates"]]
+    else:
+        return list(shape(geom).bounds)
+
+    coords = np.concatenate([np.asarray(ring, dtype=np.float64)[:, :2] for ring in rings])
+    return [*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist()]
+
 
 def create_stac_item_json(
     field: Field,
@@ -38,14 +79,13 @@ def create_stac_item_json(
         raise ValueError(f"Field {field_id} does not have {index_name.upper()} data")
 
     obs_date = datetime.strptime(date_str, "%Y-%m-%d")
-    geom_shape = shape(field.geom)
 
     return {
         "type": "Feature",
         "stac_version": "1.0.0",
         "id": f"{field_id}-{index_name}-{date_str}",
         "geometry": field.geom,
-        "bbox": list(geom_shape.bounds),
+        "bbox": _geojson_bounds(field.geom),
         "properties": {
             "datetime": obs_date.isoformat() + "Z",
             "field_id": field_id,
@@ -68,6 +108,47 @@ def create_stac_item_json(
     }
 
 
+def _put_if_absent(s3_client: Any, bucket_name: str, s3_key: str, body: bytes) -> bool:
+    """Write JSON object to S3 only if the key does not exist yet.
+
+    :param s3_client: S3 client
+    :param bucket_name: S3 bucket name
+    :param s3_key: S3 key
+    :param body: Serialised JSON body
+    :returns: True if the object was written, False if it already existed
+    """
+    try:
+        s3_client.put_object(
+            Bucket=bucket_name,
+            Key=s3_key,
+            Body=body,
+            ContentType="application/json",
+            IfNoneMatch="*",
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "PreconditionFailed":
+            return False
+        raise
+    return True
+
+
+def _stored_digest(s3_client: Any, bucket_name: str, s3_key: str) -> str | None:
+    """Get the content digest stored with a published STAC item.
+
+    :param s3_client: S3 client
+    :param bucket_name: S3 bucket name
+    :param s3_key: S3 key
+    :returns: Stored digest, "" if the object has none, or None if it does not exist
+    """
+    try:
+        head = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return str(head.get("Metadata", {}).get(STAC_DIGEST_METADATA_KEY, ""))
+
+
 def _ensure_stac_object(
     context: OpExecutionContext | AssetExecutionContext,
     s3_client: Any,
@@ -76,21 +157,15 @@ def _ensure_stac_object(
     stac_object: dict[str, Any],
     object_name: str,
 ) -> None:
-    """Ensure STAC object exists in S3, creating if missing."""
-    try:
-        s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    """Ensure STAC object exists in S3, creating if missing.
+
+    Uses a conditional PutObject so existence check and write are a single
+    atomic request.
+    """
+    if _put_if_absent(s3_client, bucket_name, s3_key, _dumps(stac_object)):
+        context.log.info(f"Created {object_name} at s3://{bucket_name}/{s3_key}")
+    else:
         context.log.debug(f"{object_name} already exists at {s3_key}")
-    except ClientError as e:
-        if e.response.get("Error", {}).get("Code") == "404":
-            s3_client.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=json.dumps(stac_object, indent=2).encode("utf-8"),
-                ContentType="application/json",
-            )
-            context.log.info(f"Created {object_name} at s3://{bucket_name}/{s3_key}")
-        else:
-            raise
 
 
 def ensure_root_catalog(
@@ -174,46 +249,22 @@ def ensure_catalog_structure(
 ) -> None:
     """Ensure root catalog and collection exist.
 
+    Buckets already ensured by this process are skipped, since neither object
+    is ever deleted by the pipeline.
+
     :param context: Dagster context
     :param s3: S3 resource
     :param settings: Settings resource
     :param bucket_name: S3 bucket name
     :param s3_client: Optional S3 client
     """
+    if bucket_name in _catalog_ensured:
+        return
     if s3_client is None:
         s3_client = s3.get_client()
     ensure_root_catalog(context, s3, bucket_name, s3_client=s3_client)
     ensure_collection(context, s3, bucket_name, s3_client=s3_client)
-
-
-def parse_partition_key(context: OpExecutionContext | AssetExecutionContext, op_name: str) -> tuple[str, str]:
-    """Parse partition key from context.
-
-    :param context: Dagster context
-    :param op_name: Operation name
-    :returns: Tuple of (date_str, field_id)
-    """
-    def _parse_key(key: str | None) -> tuple[str, str] | None:
-        if key:
-            parts = key.split("|")
-            if len(parts) == 2:
-                return parts[0], parts[1]
-        return None
-
-    run_config = getattr(context, "run_config", None)
-    if isinstance(run_config, dict):
-        partition_key = run_config.get("ops", {}).get(op_name, {}).get("config", {}).get("partition_key")
-        result = _parse_key(partition_key)
-        if result:
-            return result
-
-    run = getattr(context, "run", None)
-    if run and hasattr(run, "tags") and isinstance(run.tags, dict):
-        result = _parse_key(run.tags.get("dagster/partition"))
-        if result:
-            return result
-
-    raise ValueError("Partition key is required for STAC publishing")
+    _catalog_ensured.add(bucket_name)
 
 
 def load_field_from_s3_geoparquet(
@@ -226,6 +277,10 @@ def load_field_from_s3_geoparquet(
 ) -> Field:
     """Load field from S3 GeoParquet and convert to Field.
 
+    Only the columns needed for the STAC item are decoded, straight from
+    Arrow without building a GeoDataFrame. The GeoParquet holds statistics
+    only, so the index model carries no pixel values.
+
     :param context: Dagster context
     :param s3_client: S3 client
     :param bucket: S3 bucket name
@@ -236,19 +291,20 @@ def load_field_from_s3_geoparquet(
     """
     try:
         response = s3_client.get_object(Bucket=bucket, Key=s3_key)
-        gdf = gpd.read_parquet(io.BytesIO(response["Body"].read()))
-        row = gdf.iloc[0]
-
-        index_data = index_model_class(
-            **{index_name: []},
-            **{f"{index_name}_{attr}": row[f"{index_name}_{attr}"] for attr in ["mean", "std", "min", "max", "valid_pixel_count"]},
+        stat_columns = [f"{index_name}_{attr}" for attr in ["mean", "std", "min", "max", "valid_pixel_count"]]
+        table = pq.read_table(
+            io.BytesIO(response["Body"].read()),
+            columns=["field_id", "plant_type", "plant_date", "geometry", *stat_columns],
         )
+        row = table.slice(0, 1).to_pylist()[0]
+
+        index_data = index_model_class(**{column: row[column] for column in stat_columns})
 
         return Field(
             id=row["field_id"],
             plant_type=row["plant_type"],
             plant_date=row["plant_date"],
-            geom=gdf.geometry.iloc[0].__geo_interface__,
+            geom=mapping(wkb.loads(row["geometry"])),
             **{index_name: index_data},
         )
     except s3_client.exceptions.NoSuchKey:
@@ -284,6 +340,12 @@ def publish_stac_item_idempotent(
 ) -> str:
     """Publish STAC Item to S3 idempotently.
 
+    Items are content-addressed: the BLAKE2b digest of the serialized item
+    is stored as object metadata, and the PUT is skipped when the stored
+    digest matches, so unchanged items are never re-uploaded while changed
+    ones replace the stale copy. Digests published by this process are
+    remembered, so repeats skip the S3 request entirely.
+
     :param context: Dagster context
     :param s3: S3 resource
     :param settings: Settings resource
@@ -303,61 +365,24 @@ def publish_stac_item_idempotent(
         s3_client = s3.get_client()
     bucket = settings.aws_s3_pipeline_bucket_name
 
-    try:
-        s3_client.head_object(Bucket=bucket, Key=s3_key)
-        context.log.info(f"STAC item already exists at {s3_key}, skipping registration (idempotent)")
+    body = _dumps(stac_item)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    published_key = f"{bucket}/{s3_key}"
+    if _published_items.get(published_key) == digest:
+        context.log.info(f"STAC item already published at {s3_key} by this process, skipping")
         return s3_key
-    except ClientError as e:
-        if e.response.get("Error", {}).get("Code") == "404":
-            s3_client.put_object(
-                Bucket=bucket,
-                Key=s3_key,
-                Body=json.dumps(stac_item, indent=2).encode("utf-8"),
-                ContentType="application/json",
-            )
-            context.log.info(f"Published STAC item to S3: s3://{bucket}/{s3_key}")
-            return s3_key
-        raise
 
+    if _stored_digest(s3_client, bucket, s3_key) == digest:
+        context.log.info(f"STAC item at {s3_key} is unchanged, skipping registration (idempotent)")
+    else:
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=s3_key,
+            Body=body,
+            ContentType="application/json",
+            Metadata={STAC_DIGEST_METADATA_KEY: digest},
+        )
+        context.log.info(f"Published STAC item to S3: s3://{bucket}/{s3_key}")
+    _published_items[published_key] = digest
+    return s3_key
 
-def publish_spectral_index_to_stac(
-    context: OpExecutionContext | AssetExecutionContext,
-    s3: S3Resource,
-    settings: SettingsResource,
-    index_name: str,
-    index_model_class: type,
-    op_name: str,
-) -> str:
-    """Publish spectral index to STAC.
-
-    :param context: Dagster context
-    :param s3: S3 resource
-    :param settings: Settings resource
-    :param index_name: Index name (e.g., "ndvi", "ndmi")
-    :param index_model_class: Index model class (NDVI or NDMI)
-    :param op_name: Operation name for partition key extraction
-    :returns: S3 key where STAC item was published
-    """
-    try:
-        if hasattr(context, "partition_key") and context.partition_key:
-            parts = context.partition_key.split("|")
-            if len(parts) == 2:
-                date_str, field_id = parts
-            else:
-                date_str, field_id = parse_partition_key(context, op_name)
-        else:
-            date_str, field_id = parse_partition_key(context, op_name)
-    except Exception:
-        date_str, field_id = parse_partition_key(context, op_name)
-
-    s3_client = s3.get_client()
-    bucket = settings.aws_s3_pipeline_bucket_name
-    s3_key = f"pipeline-outputs/{field_id}/{index_name}/{date_str}.parquet"
-
-    field = load_field_from_s3_geoparquet(context, s3_client, bucket, s3_key, index_name, index_model_class)
-    ensure_catalog_structure(context, s3, settings, bucket, s3_client=s3_client)
-
-    stac_item = create_stac_item_json(field, date_str, field_id, index_name, s3_key, bucket)
-    add_stac_links(stac_item, bucket, field_id, index_name, date_str)
-
-    return publish_stac_item_idempotent(context, s3, settings, stac_item, s3_client=s3_client)
@@ -1,18 +1,26 @@
 """Storage operations for S3 and STAC catalog I/O."""
 
+import atexit
 import io
-import json
 import os
+from collections import deque
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
 import geopandas as gpd
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
 from dagster import AssetExecutionContext, OpExecutionContext
 from dagster_aws.s3 import S3PickleIOManager, S3Resource as DagsterS3Resource
-from jsonpath_ng.ext import parse
-from shapely.geometry import shape
+from pyproj import CRS
 
-from plantation_monitoring.connectors.s3_client import S3Resource
+from plantation_monitoring.connectors.s3_client import S3Resource, upload_bytes
 from plantation_monitoring.connectors.settings import SettingsResource
 from plantation_monitoring.geospatial.stac_publisher import (
     add_stac_links,
@@ -22,6 +30,19 @@ from plantation_monitoring.geospatial.stac_publisher import (
 )
 from plantation_monitoring.models.models import Field
 
+S3_POOL_MAX_WORKERS = 32
+DELETE_BATCH_SIZE = 1000
+SINGLE_COPY_MAX_BYTES = 5 * 1024**3
+GEOJSON_FETCH_MAX_WORKERS = 16
+GEOPARQUET_VERSION = "1.0.0"
+
+# Reads the (plant-type, plant-date) pair from a field feature's properties.
+_FIELD_PROPERTIES = itemgetter("plant-type", "plant-date")
+
+# Shared by all S3 fan-out in this module so threads are created once per process.
+_S3_POOL = ThreadPoolExecutor(max_workers=S3_POOL_MAX_WORKERS, thread_name_prefix="s3")
+atexit.register(_S3_POOL.shutdown, wait=False, cancel_futures=True)
+
 
 def move_s3_files(
     context: OpExecutionContext,
@@ -32,6 +53,10 @@ def move_s3_files(
 ) -> None:
     """Move S3 files from source to destination prefix.
 
+    Objects are copied concurrently on the shared S3 pool; sources are only removed once every copy
+    has succeeded, using batched DeleteObjects requests. Objects too large for
+    a single CopyObject (5 GiB) go through the managed multipart copy.
+
     :param context: Dagster context
     :param s3: S3 resource
     :param settings: Settings resource
@@ -46,17 +71,29 @@ def move_s3_files(
 
     context.log.debug(f"Moving files from {source_prefix} to {dest_prefix}")
 
-    for page in page_iterator:
-        for obj in page.get("Contents", []):
-            source_key = obj["Key"]
-            dest_key = source_key.replace(source_prefix, dest_prefix, 1)
-
-            s3_client.copy_object(
-                Bucket=bucket,
-                CopySource={"Bucket": bucket, "Key": source_key},
-                Key=dest_key,
-            )
-            s3_client.delete_object(Bucket=bucket, Key=source_key)
+    source_objects = [obj for page in page_iterator for obj in page.get("Contents", [])]
+    if not source_objects:
+        return
+    source_keys = [obj["Key"] for obj in source_objects]
+
+    def copy_to_dest(obj: dict[str, Any]) -> None:
+        copy_source = {"Bucket": bucket, "Key": obj["Key"]}
+        dest_key = obj["Key"].replace(source_prefix, dest_prefix, 1)
+        if obj.get("Size", 0) < SINGLE_COPY_MAX_BYTES:
+            s3_client.copy_object(Bucket=bucket, CopySource=copy_source, Key=dest_key)
+        else:
+            s3_client.copy(copy_source, bucket, dest_key)
+
+    list(_S3_POOL.map(copy_to_dest, source_objects))
+
+    for start in range(0, len(source_keys), DELETE_BATCH_SIZE):
+        batch = source_keys[start : start + DELETE_BATCH_SIZE]
+        response = s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+        for error in response.get("Errors", []):
+            context.log.error(f"Could not delete {error.get('Key')}: {error.get('Message')}")
 
     context.log.debug(f"Moved files from {source_prefix} to {dest_prefix}")
 
@@ -66,47 +103,89 @@ def list_geojson_files(
     s3: S3Resource,
     settings: SettingsResource,
     prefix: str,
+    limit: int | None = None,
 ) -> Generator[tuple[str, dict[str, Any]], None, None]:
     """List and yield GeoJSON files from S3 prefix.
 
+    Listing is paginated so prefixes with more than 1000 objects are covered.
+    Bodies are fetched concurrently, with at most ``limit`` (or
+    GEOJSON_FETCH_MAX_WORKERS) requests in flight, and yielded in key order.
+    New fetches are only started as results are consumed, so a caller that
+    stops early leaves no downloads queued.
+
     :param context: Dagster context
     :param s3: S3 resource
     :param settings: Settings resource
     :param prefix: S3 prefix
+    :param limit: Maximum number of files to yield, or None for all
     :yields: Tuple of (s3_key, geojson_content)
     """
     bucket = settings.aws_s3_pipeline_bucket_name
     s3_client = s3.get_client()
-    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+    paginator = s3_client.get_paginator("list_objects_v2")
 
-    if "Contents" not in response:
+    keys = [obj["Key"] for page in paginator.paginate(Bucket=bucket, Prefix=prefix) for obj in page.get("Contents", [])]
+    if not keys:
         context.log.warning(f"No files found in {bucket}/{prefix}")
         return
 
-    for obj in response.get("Contents", []):
-        key = obj["Key"]
-        if not key.endswith(".geojson"):
-            continue
+    geojson_keys = iter([key for key in keys if key.endswith(".geojson")])
 
+    def load_geojson(key: str) -> dict[str, Any] | None:
         context.log.debug(f"Loading {key}")
         try:
             s3_object = s3_client.get_object(Bucket=bucket, Key=key)
-            content = json.loads(s3_object["Body"].read().decode("utf-8"))
-            yield key, content
+            return orjson.loads(s3_object["Body"].read())
         except Exception as e:
             context.log.error(f"Error processing {key}: {e}")
+            return None
+
+    max_in_flight = min(GEOJSON_FETCH_MAX_WORKERS, limit or GEOJSON_FETCH_MAX_WORKERS)
+    yielded = 0
+    pending = deque((key, _S3_POOL.submit(load_geojson, key)) for key in islice(geojson_keys, max_in_flight))
+    try:
+        while pending:
+            key, future = pending.popleft()
+            content = future.result()
+            if content is not None:
+                yield key, content
+                yielded += 1
+                if yielded == limit:
+                    return
+            next_key = next(geojson_keys, None)
+            if next_key is not None:
+                pending.append((next_key, _S3_POOL.submit(load_geojson, next_key)))
+    finally:
+        for _, future in pending:
+            future.cancel()
 
 
 def extract_fields_from_geojson(geojson_content: dict[str, Any]) -> Generator[tuple[str, dict[str, Any]], None, None]:
-    """Extract field features from GeoJSON using JSONPath.
+    """Extract features whose "object-type" property is "field" from GeoJSON.
 
     :param geojson_content: GeoJSON dictionary
     :yields: Tuple of (field_id, field_feature)
     """
-    jsonpath_expr = parse('$.features[?(@.properties["object-type"] == "field")]')
-    for match in jsonpath_expr.find(geojson_content):
-        field_id = str(match.value["properties"]["object-id"])
-        yield field_id, match.value
+    for feature in geojson_content.get("features", []):
+        properties = feature.get("properties") or {}
+        if properties.get("object-type") == "field":
+            yield str(properties["object-id"]), feature
+
+
+def _features_to_geodataframe(features: list[dict[str, Any]]) -> gpd.GeoDataFrame:
+    """Build a GeoDataFrame from GeoJSON features.
+
+    Geometries are parsed in one vectorized shapely.from_geojson call rather
+    than one shape() call per feature; null geometries stay missing.
+
+    :param features: GeoJSON feature dictionaries
+    :returns: GeoDataFrame in EPSG:4326 with a column per property
+    """
+    geometries = shapely.from_geojson(
+        [None if feature.get("geometry") is None else orjson.dumps(feature["geometry"]) for feature in features]
+    )
+    properties = [feature.get("properties") or {} for feature in features]
+    return gpd.GeoDataFrame(properties, geometry=geometries, crs="EPSG:4326")
 
 
 def load_geojson_from_s3(
@@ -119,7 +198,9 @@ def load_geojson_from_s3(
 ) -> gpd.GeoDataFrame | None:
     """Load GeoJSON from S3.
 
-    Checks processed, then staging, then fallback. Moves staging files to processed.
+    Exactly one GeoJSON file is used; files are not merged. The first staging
+    file (in key order) wins, then the first processed file, then the
+    fallback key. Staging files are moved to processed when one was found.
 
     :param context: Dagster context
     :param s3: S3 resource
@@ -130,19 +211,16 @@ def load_geojson_from_s3(
     :returns: GeoDataFrame if found, None otherwise
     """
     gdf = None
-    has_new_files = False
-
-    for key, content in list_geojson_files(context, s3, settings, processed_prefix):
-        gdf = gpd.GeoDataFrame.from_features(content.get("features", []), crs="EPSG:4326")
-        break
-
-    for key, content in list_geojson_files(context, s3, settings, staging_prefix):
-        has_new_files = True
-        gdf = gpd.GeoDataFrame.from_features(content.get("features", []), crs="EPSG:4326")
-        break
-
-    if has_new_files:
+    content = next((content for _, content in list_geojson_files(context, s3, settings, staging_prefix, limit=1)), None)
+    if content is not None:
         move_s3_files(context, s3, settings, staging_prefix, processed_prefix)
+    else:
+        content = next(
+            (content for _, content in list_geojson_files(context, s3, settings, processed_prefix, limit=1)), None
+        )
+
+    if content is not None:
+        gdf = _features_to_geodataframe(content.get("features", []))
 
     if gdf is None and fallback_key:
         try:
@@ -167,7 +245,9 @@ def load_fields_from_s3(
 ) -> tuple[list[Field], set[str]]:
     """Load fields from S3.
 
-    Checks processed then staging. Moves staging files to processed.
+    Checks processed then staging. Moves staging files to processed. The first
+    feature seen for a field ID wins; staging fields not already processed
+    are reported as new.
 
     :param context: Dagster context
     :param s3: S3 resource
@@ -176,29 +256,23 @@ def load_fields_from_s3(
     :param staging_prefix: Staging prefix
     :returns: Tuple of (all_fields, new_field_ids)
     """
-    field_ids = set()
-    all_fields = []
-    has_new_files = False
-
+    features: dict[str, dict[str, Any]] = {}
     for _, content in list_geojson_files(context, s3, settings, processed_prefix):
         for field_id, field_feature in extract_fields_from_geojson(content):
-            if field_id in field_ids:
-                continue
-            all_fields.append(_create_field_from_feature(field_id, field_feature))
-            field_ids.add(field_id)
+            features.setdefault(field_id, field_feature)
+    processed_count = len(features)
 
-    new_field_ids = set()
+    has_new_files = False
     for _, content in list_geojson_files(context, s3, settings, staging_prefix):
         has_new_files = True
         for field_id, field_feature in extract_fields_from_geojson(content):
-            if field_id not in field_ids:
-                all_fields.append(_create_field_from_feature(field_id, field_feature))
-                field_ids.add(field_id)
-                new_field_ids.add(field_id)
+            features.setdefault(field_id, field_feature)
 
     if has_new_files:
         move_s3_files(context, s3, settings, staging_prefix, processed_prefix)
 
+    all_fields = [_create_field_from_feature(field_id, field_feature) for field_id, field_feature in features.items()]
+    new_field_ids = set(islice(features, processed_count, None))
     return all_fields, new_field_ids
 
 
@@ -209,12 +283,37 @@ def _create_field_from_feature(field_id: str, field_feature: dict[str, Any]) ->
     :param field_feature: GeoJSON feature dictionary
     :returns: Field instance
     """
-    return Field(
-        id=field_id,
-        plant_type=field_feature["properties"]["plant-type"],
-        plant_date=field_feature["properties"]["plant-date"],
-        geom=field_feature["geometry"],
-    )
+    plant_type, plant_date = _FIELD_PROPERTIES(field_feature["properties"])
+    return Field(id=field_id, plant_type=plant_type, plant_date=plant_date, geom=field_feature["geometry"])
+
+
+@lru_cache(maxsize=1)
+def _wgs84_projjson() -> dict[str, Any]:
+    """Get the PROJJSON definition of EPSG:4326 for GeoParquet metadata.
+
+    :returns: PROJJSON dictionary
+    """
+    return CRS.from_epsg(4326).to_json_dict()
+
+
+def _geoparquet_metadata(geometry: Any) -> dict[str, Any]:
+    """Build GeoParquet 1.0 file metadata for a single WKB geometry column.
+
+    :param geometry: Shapely geometry stored in the "geometry" column
+    :returns: Value for the "geo" schema metadata key
+    """
+    return {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "WKB",
+                "crs": _wgs84_projjson(),
+                "geometry_types": [geometry.geom_type],
+                "bbox": list(geometry.bounds),
+            }
+        },
+    }
 
 
 def save_spectral_index_to_s3(
@@ -244,36 +343,29 @@ def save_spectral_index_to_s3(
     if index_data is None:
         raise ValueError(f"Field {field_id} does not have {index_name.upper()} data to write")
 
-    gdf = gpd.GeoDataFrame(
-        [
-            {
-                "field_id": field.id,
-                "plant_type": field.plant_type,
-                "plant_date": field.plant_date,
-                f"{index_name}_mean": getattr(index_data, f"{index_name}_mean"),
-                f"{index_name}_std": getattr(index_data, f"{index_name}_std"),
-                f"{index_name}_min": getattr(index_data, f"{index_name}_min"),
-                f"{index_name}_max": getattr(index_data, f"{index_name}_max"),
-                f"{index_name}_valid_pixel_count": getattr(index_data, f"{index_name}_valid_pixel_count"),
-                "geometry": shape(field.geom),
-            }
-        ],
-        crs="EPSG:4326",
+    geometry = field.shapely_geom
+    table = pa.table(
+        {
+            "field_id": [field.id],
+            "plant_type": [field.plant_type],
+            "plant_date": [field.plant_date],
+            f"{index_name}_mean": [getattr(index_data, f"{index_name}_mean")],
+            f"{index_name}_std": [getattr(index_data, f"{index_name}_std")],
+            f"{index_name}_min": [getattr(index_data, f"{index_name}_min")],
+            f"{index_name}_max": [getattr(index_data, f"{index_name}_max")],
+            f"{index_name}_valid_pixel_count": [getattr(index_data, f"{index_name}_valid_pixel_count")],
+            "geometry": pa.array([geometry.wkb], type=pa.binary()),
+        }
     )
+    table = table.replace_schema_metadata({b"geo": orjson.dumps(_geoparquet_metadata(geometry))})
 
     parquet_buffer = io.BytesIO()
-    gdf.to_parquet(parquet_buffer, engine="pyarrow", index=False)
-    parquet_buffer.seek(0)
+    pq.write_table(table, parquet_buffer, compression="zstd", use_dictionary=False)
 
     s3_key = f"pipeline-outputs/{field_id}/{index_name}/{date_str}.parquet"
     if s3_client is None:
         s3_client = s3.get_client()
-    s3_client.upload_fileobj(
-        parquet_buffer,
-        Bucket=settings.aws_s3_pipeline_bucket_name,
-        Key=s3_key,
-        ExtraArgs={"ContentType": "application/parquet"},
-    )
+    upload_bytes(s3_client, settings.aws_s3_pipeline_bucket_name, s3_key, parquet_buffer, "application/parquet")
 
     context.log.info(f"Written {index_name.upper()} data to S3: s3://{settings.aws_s3_pipeline_bucket_name}/{s3_key}")
     return s3_key
@@ -1,9 +1,9 @@
 """S3 file sensors for detecting new files and triggering jobs."""
 
-import json
 from collections.abc import Generator
 from typing import Any
 
+import orjson
 from dagster import (
     DefaultSensorStatus,
     RunRequest,
@@ -20,6 +20,20 @@ from plantation_monitoring.connectors.settings import SettingsResource
 from plantation_monitoring.triggers.jobs import bbox_job, fields_job
 
 
+def _list_keys(s3_client: Any, bucket: str, prefix: str) -> Generator[str, None, None]:
+    """List object keys under an S3 prefix, one listing page at a time.
+
+    :param s3_client: Boto3 S3 client
+    :param bucket: Bucket name
+    :param prefix: S3 prefix to list
+    :yields: Object keys
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            yield obj["Key"]
+
+
 def _detect_new_s3_files(
     context: SensorEvaluationContext,
     s3: S3Resource,
@@ -28,6 +42,10 @@ def _detect_new_s3_files(
 ) -> Generator[RunRequest, None, None]:
     """Detect new files in S3 prefix by comparing with previous state.
 
+    The cursor stores the sorted list of keys seen, so an unchanged prefix
+    always produces the same cursor. New keys are found by set difference
+    and requested in key order.
+
     :param context: Sensor evaluation context
     :param s3: S3 resource
     :param settings: Settings resource
@@ -37,15 +55,14 @@ def _detect_new_s3_files(
     s3_client = s3.get_client()
     bucket = settings.aws_s3_pipeline_bucket_name
 
-    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-    all_files = [obj["Key"] for obj in response.get("Contents", [])]
-    previous_files = json.loads(context.cursor) if context.cursor else []
-    new_files = list(set(all_files) - set(previous_files))
-    context.update_cursor(json.dumps(all_files))
+    all_files = set(_list_keys(s3_client, bucket, prefix))
+    previous_files = set(orjson.loads(context.cursor)) if context.cursor else set()
+    new_files = all_files - previous_files
+    context.update_cursor(orjson.dumps(sorted(all_files)).decode())
 
     if new_files:
         context.log.info(f"Found {len(new_files)} new file(s) in {prefix}: {new_files}")
-        for file_key in new_files:
+        for file_key in sorted(new_files):
             yield RunRequest(run_key=file_key)
 
 
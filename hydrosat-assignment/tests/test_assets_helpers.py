@@ -1,5 +1,9 @@
+import os
+from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
+
 from plantation_monitoring import assets
 from plantation_monitoring.config.constants import NDVI_BAND_PREFERENCES
 from plantation_monitoring.models.models import Field
@@ -89,3 +93,72 @@ def test_prepare_band_urls_missing_band_returns_error() -> None:
     if hasattr(error_msg, "value"):
         error_msg = error_msg.value
     assert "Could not find required bands" in str(error_msg)
+
+
+def test_compute_index_array_reuses_disk_cache(tmp_path: Path) -> None:
+    """
+    Test that computed index arrays are cached on disk.
+
+    A second computation for the same COGs and geometry should be served
+    from the cache even when the signed URL tokens differ.
+    """
+    calls = []
+
+    def compute_ndvi(red_url: str, nir_url: str, bbox_geom: object) -> np.ndarray:
+        calls.append((red_url, nir_url))
+        return np.array([[0.5, np.nan]], dtype=np.float32)
+
+    geometry = {"type": "Point", "coordinates": [0, 0]}
+    first = assets._compute_index_array(
+        compute_ndvi, {"red": "http://red?sig=a", "nir": "http://nir?sig=a"}, geometry, cache_dir=str(tmp_path)
+    )
+    second = assets._compute_index_array(
+        compute_ndvi, {"red": "http://red?sig=b", "nir": "http://nir?sig=b"}, geometry, cache_dir=str(tmp_path)
+    )
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first, second)
+    assert second.dtype == np.float32
+
+
+def test_compute_index_array_recomputes_unreadable_cache_entry(tmp_path: Path) -> None:
+    """
+    Test that a corrupt cached array is discarded and recomputed.
+
+    Verifies that a truncated .npy file does not fail the computation and
+    is replaced by a readable array.
+    """
+    calls = []
+
+    def compute_ndvi(red_url: str, nir_url: str, bbox_geom: object) -> np.ndarray:
+        calls.append(red_url)
+        return np.array([[0.25]], dtype=np.float32)
+
+    geometry = {"type": "Point", "coordinates": [0, 0]}
+    band_urls = {"red": "http://red", "nir": "http://nir"}
+    cache_key = assets._index_cache_key(compute_ndvi, band_urls, geometry)
+    cache_path = tmp_path / assets.INDEX_CACHE_DIRNAME / f"{cache_key}.npy"
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b"\x93NUMPY")
+
+    result = assets._compute_index_array(compute_ndvi, band_urls, geometry, cache_dir=str(tmp_path))
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(result, np.load(cache_path))
+
+
+def test_prune_index_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """
+    Test that the index cache is kept within its size budget.
+
+    Verifies that the oldest arrays are evicted first and that the newest
+    arrays within the budget are kept.
+    """
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = tmp_path / f"{name}.npy"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+    assets._prune_index_cache(tmp_path, max_bytes=250)
+
+    assert sorted(path.stem for path in tmp_path.glob("*.npy")) == ["middle", "newest"]
@@ -3,6 +3,7 @@ from typing import Any
 
 import pytest
 
+from plantation_monitoring.connectors import s3_client as s3_client_module
 from plantation_monitoring.connectors.s3_client import S3Resource
 from plantation_monitoring.connectors.settings import SettingsResource
 from plantation_monitoring.connectors.stac_client import STACResource
@@ -97,3 +98,98 @@ def test_stac_resource_creates_client(monkeypatch: pytest.MonkeyPatch) -> None:
     client = resource.create_client()
     assert client == "fake-client"
     assert created["url"] == "http://stac"
+
+
+def test_s3_resource_get_client_reuses_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that S3Resource.get_client builds the boto3 client only once.
+
+    Verifies that repeated calls return the same client instance without
+    constructing a new one, and that teardown closes it.
+    """
+    created: list[Any] = []
+
+    def fake_client(service: str, **kwargs: Any) -> Any:
+        client = SimpleNamespace(service=service, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr("boto3.client", fake_client)
+
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_S3_ENDPOINT", "http://localhost:9000")
+    monkeypatch.setenv("AWS_S3_PIPELINE_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("AWS_S3_USE_SSL", "false")
+    monkeypatch.setenv("STAC_API_URL", "http://stac")
+
+    settings = SettingsResource.create(swallow_errors=True)
+    resource = S3Resource(settings=settings)
+    assert resource.get_client() is resource.get_client()
+    assert len(created) == 1
+    assert created[0].endpoint_url == "http://localhost:9000"
+
+    closed: list[bool] = []
+    created[0].close = lambda: closed.append(True)
+    resource.teardown_after_execution(context=None)  # type: ignore[arg-type]
+    assert closed == [True]
+    assert resource.get_client() is not created[0]
+
+
+def test_settings_resolves_env_vars_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that SettingsResource memoizes EnvVar-backed values.
+
+    Verifies that the cloud cover threshold is read from the environment
+    during initialisation and not re-read afterwards.
+    """
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_S3_ENDPOINT", "http://localhost:9000")
+    monkeypatch.setenv("AWS_S3_PIPELINE_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("TMP_DIR", "/tmp")
+    monkeypatch.setenv("STAC_API_URL", "http://stac")
+    monkeypatch.setenv("DAGSTER_PARTITION_START_DATE", "2025-01-01")
+    monkeypatch.setenv("CLOUD_COVER_THRESHOLD", "15")
+
+    settings = SettingsResource()
+    settings._post_init()
+    assert settings.get_cloud_cover_threshold() == 15
+
+    monkeypatch.setenv("CLOUD_COVER_THRESHOLD", "50")
+    assert settings.get_cloud_cover_threshold() == 15
+
+
+def test_settings_validate_reports_every_missing_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that validation covers every EnvVar-backed setting.
+
+    Verifies that TMP_DIR and CLOUD_COVER_THRESHOLD are reported when they
+    are configured as EnvVar but unset, while plain defaults are not.
+    """
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_S3_ENDPOINT", "http://localhost:9000")
+    monkeypatch.setenv("AWS_S3_PIPELINE_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("STAC_API_URL", "http://stac")
+    monkeypatch.setenv("DAGSTER_PARTITION_START_DATE", "2025-01-01")
+    monkeypatch.delenv("TMP_DIR", raising=False)
+    monkeypatch.delenv("CLOUD_COVER_THRESHOLD", raising=False)
+
+    with pytest.raises(ValueError) as excinfo:
+        SettingsResource().validate_settings()
+    assert str(excinfo.value) == "Missing mandatory environment variables: CLOUD_COVER_THRESHOLD, TMP_DIR"
+
+
+def test_upload_bytes_uses_single_put_for_small_payloads() -> None:
+    """
+    Test that small payloads use PutObject and large ones the managed upload.
+    """
+    calls: list[tuple[str, str]] = []
+    client = SimpleNamespace(
+        put_object=lambda **kwargs: calls.append(("put_object", kwargs["Key"])),
+        upload_fileobj=lambda fileobj, **kwargs: calls.append(("upload_fileobj", kwargs["Key"])),
+    )
+
+    s3_client_module.upload_bytes(client, "bucket", "small", b"{}", "application/json")
+    large_body = b"0" * s3_client_module.SINGLE_PUT_MAX_BYTES
+    s3_client_module.upload_bytes(client, "bucket", "large", large_body, "application/json")
+
+    assert calls == [("put_object", "small"), ("upload_fileobj", "large")]
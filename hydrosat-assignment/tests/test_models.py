@@ -0,0 +1,90 @@
+import uuid
+
+import numpy as np
+import pytest
+from shapely.geometry import Point, box
+
+from plantation_monitoring.models.models import NDMI, NDVI, Bbox, Field
+
+
+@pytest.mark.parametrize(("model_class", "name"), [(NDVI, "ndvi"), (NDMI, "ndmi")])
+def test_index_from_array_ignores_nan_pixels(model_class: type, name: str) -> None:
+    """
+    Test that index statistics are computed over non-NaN pixels only.
+    """
+    array = np.array([[0.1, np.nan], [0.5, 0.3]], dtype=np.float32)
+
+    index = model_class.from_array(array)
+
+    assert getattr(index, f"{name}_valid_pixel_count") == 3
+    assert getattr(index, f"{name}_mean") == pytest.approx(0.3)
+    assert getattr(index, f"{name}_std") == pytest.approx(np.std([0.1, 0.5, 0.3]))
+    assert getattr(index, f"{name}_min") == pytest.approx(0.1)
+    assert getattr(index, f"{name}_max") == pytest.approx(0.5)
+
+
+def test_index_from_array_all_nan_returns_zeros() -> None:
+    """
+    Test that an array without valid pixels yields zeroed statistics.
+    """
+    index = NDVI.from_array(np.full((2, 2), np.nan, dtype=np.float32))
+
+    assert index.ndvi_valid_pixel_count == 0
+    assert (index.ndvi_mean, index.ndvi_std, index.ndvi_min, index.ndvi_max) == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_index_round_trips_array_through_bytes() -> None:
+    """
+    Test that the stored index bytes reconstruct the original array, also after JSON round-trip.
+    """
+    array = np.array([[0.1, np.nan, 0.2], [0.5, 0.3, -0.4]], dtype=np.float32)
+
+    index = NDMI.from_array(array)
+    restored = NDMI.model_validate_json(index.model_dump_json())
+
+    np.testing.assert_allclose(index.to_array(), array, atol=5e-5)
+    np.testing.assert_array_equal(restored.to_array(), index.to_array())
+    assert restored.shape == (2, 3)
+
+
+def test_index_stores_scaled_int16_pixels() -> None:
+    """
+    Test that index pixels are stored as int16 scaled by 10000, clipped to
+    the index range, with NaN stored as nodata.
+    """
+    array = np.array([[0.12344, np.nan], [-1.5, 1.0]], dtype=np.float32)
+
+    index = NDVI.from_array(array)
+
+    assert index.dtype == "int16"
+    assert len(index.ndvi) == array.size * 2
+    np.testing.assert_array_equal(
+        np.frombuffer(index.ndvi, dtype=np.int16).reshape(2, 2), [[1234, -32768], [-10000, 10000]]
+    )
+    np.testing.assert_allclose(index.to_array(), [[0.1234, np.nan], [-1.0, 1.0]], atol=1e-6)
+
+
+def test_field_shapely_geom_is_cached_per_geometry() -> None:
+    """
+    Test that Field.shapely_geom is built once and rebuilt when geom is replaced.
+    """
+    field = Field(id="f1", plant_type="wheat", plant_date="2024-01-01", geom={"type": "Point", "coordinates": [0, 0]})
+
+    assert field.shapely_geom is field.shapely_geom
+    assert field.shapely_geom.equals(Point(0, 0))
+
+    moved = field.model_copy(update={"geom": {"type": "Point", "coordinates": [1, 1]}})
+    assert moved.shapely_geom.equals(Point(1, 1))
+
+
+def test_bbox_id_is_deterministic_per_geometry() -> None:
+    """
+    Test that Bbox IDs depend only on the geometry.
+
+    Verifies that IDs are stable, differ between geometries and are
+    RFC 4122 version 5 UUIDs.
+    """
+    bbox_id = Bbox.get_id_from_geom(box(0, 0, 1, 1))
+    assert (bbox_id.version, bbox_id.variant) == (5, uuid.RFC_4122)
+    assert Bbox.get_id_from_geom(box(0, 0, 1, 1)) == bbox_id
+    assert Bbox.get_id_from_geom(box(0, 0, 1, 1)) != Bbox.get_id_from_geom(box(0, 0, 2, 1))
@@ -2,12 +2,16 @@ from pathlib import Path
 
 import numpy as np
 import rasterio
+import rasterio.mask
 from affine import Affine
 from numpy.typing import NDArray
-from shapely.geometry import Polygon, mapping
+from shapely.geometry import Point, Polygon, mapping
 
 from plantation_monitoring.geospatial import raster_ops
 
+# One-degree pixels starting at (0, 0), with y decreasing downwards
+_DEFAULT_TRANSFORM = Affine(1, 0, 0, 0, -1, 0)
+
 
 def _write_geotiff(
     path: Path, data: NDArray[np.floating], crs: str = "EPSG:4326", transform: Affine | None = None
@@ -22,7 +26,7 @@ def _write_geotiff(
       transform: Affine transform (defaults to simple scale)
     """
     height, width = data.shape
-    transform = transform or Affine.translation(0, 0) * Affine.scale(1, -1)
+    transform = transform or _DEFAULT_TRANSFORM
     with rasterio.open(
         path,
         "w",
@@ -46,8 +50,7 @@ def test_read_band_window_masks_to_geometry(tmp_path: Path) -> None:
     """
     data = np.array([[1, 2], [3, 4]], dtype="float32")
     tif_path = tmp_path / "test.tif"
-    # One-degree pixels starting at (0,0); y decreasing to match Affine.scale(1, -1)
-    transform = Affine.translation(0, 0) * Affine.scale(1, -1)
+    transform = _DEFAULT_TRANSFORM
     _write_geotiff(tif_path, data, transform=transform)
 
     # Geometry covers only the top-left pixel
@@ -58,6 +61,26 @@ def test_read_band_window_masks_to_geometry(tmp_path: Path) -> None:
     np.testing.assert_allclose(window[0, 0], 1.0)
 
 
+def test_read_band_window_reads_single_pixel_for_point(tmp_path: Path) -> None:
+    """
+    Test that a point geometry reads the one pixel containing it.
+
+    The result must match the rasterio.mask path for the same point.
+    """
+    data = np.arange(12, dtype="float32").reshape(3, 4)
+    tif_path = tmp_path / "test.tif"
+    _write_geotiff(tif_path, data, transform=_DEFAULT_TRANSFORM)
+    point = mapping(Point(2.5, -1.5))
+
+    window = raster_ops.read_band_window(str(tif_path), point, geom_crs="EPSG:4326")
+
+    with rasterio.open(tif_path) as src:
+        masked, _ = rasterio.mask.mask(src, [point], crop=True)
+    assert window.shape == masked.shape[1:] == (1, 1)
+    np.testing.assert_allclose(window, masked[0])
+    np.testing.assert_allclose(window[0, 0], 6.0)
+
+
 def test_compute_ndvi_from_cog_urls_matches_expected(tmp_path: Path) -> None:
     """
     Test that NDVI computation produces expected results.
@@ -99,3 +122,16 @@ def test_compute_ndmi_from_cog_urls_resamples_swir(tmp_path: Path) -> None:
     valid_mask = ~np.isnan(ndmi)
     assert np.any(valid_mask), "Should have at least some valid pixels"
     np.testing.assert_allclose(ndmi[valid_mask], expected_value, rtol=1e-2, atol=1e-2)
+
+
+def test_normalized_difference_marks_zero_sum_pixels_nan() -> None:
+    """
+    Test that pixels where both bands are zero yield NaN instead of 0.
+    """
+    nir = np.array([[3, 0]], dtype=np.uint16)
+    red = np.array([[1, 0]], dtype=np.uint16)
+
+    result = raster_ops._normalized_difference(nir, red)
+
+    assert result[0, 0] == np.float32(0.5)
+    assert np.isnan(result[0, 1])
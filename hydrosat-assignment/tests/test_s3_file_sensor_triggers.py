@@ -7,6 +7,8 @@ from plantation_monitoring.triggers import s3_file_sensor
 
 
 class FakeContext:
+    __slots__ = ("cursor", "updated_cursor", "logs")
+
     def __init__(self, cursor=None):
         self.cursor = cursor
         self.updated_cursor = None
@@ -20,15 +22,32 @@ class FakeContext:
         return SimpleNamespace(info=lambda *args, **kwargs: self.logs.append(("info", args, kwargs)))
 
 
+class FakePaginator:
+    __slots__ = ("keys", "page_size")
+
+    def __init__(self, keys, page_size=1):
+        self.keys = keys
+        self.page_size = page_size
+
+    def paginate(self, Bucket, Prefix):
+        matching = [k for k in self.keys if k.startswith(Prefix)]
+        for start in range(0, len(matching), self.page_size):
+            yield {"Contents": [{"Key": k} for k in matching[start : start + self.page_size]]}
+
+
 class FakeS3Client:
+    __slots__ = ("keys",)
+
     def __init__(self, keys):
-        self.keys = keys
+        self.keys = tuple(keys)
 
-    def list_objects_v2(self, Bucket, Prefix):
-        return {"Contents": [{"Key": k} for k in self.keys if k.startswith(Prefix)]}
+    def get_paginator(self, name):
+        return FakePaginator(self.keys)
 
 
 class FakeS3Resource:
+    __slots__ = ("client",)
+
     def __init__(self, keys):
         self.client = FakeS3Client(keys)
 
@@ -49,7 +68,7 @@ def test_detect_new_s3_files_emits_run_requests(fake_settings: SimpleNamespace)
     the sensor should emit RunRequests for each new file.
     """
     context = FakeContext(cursor=None)
-    s3 = FakeS3Resource(keys=["raw_catalog/fields/staging/file1.geojson", "raw_catalog/fields/staging/file2.geojson"])
+    s3 = FakeS3Resource(keys=["raw_catalog/fields/staging/file2.geojson", "raw_catalog/fields/staging/file1.geojson"])
     run_requests = list(
         s3_file_sensor._detect_new_s3_files(
             context=context,
@@ -59,11 +78,10 @@ def test_detect_new_s3_files_emits_run_requests(fake_settings: SimpleNamespace)
         )
     )
 
-    assert len(run_requests) == 2
-    assert {r.run_key for r in run_requests} == {
+    assert [r.run_key for r in run_requests] == [
         "raw_catalog/fields/staging/file1.geojson",
         "raw_catalog/fields/staging/file2.geojson",
-    }
+    ]
     assert json.loads(context.updated_cursor) == [
         "raw_catalog/fields/staging/file1.geojson",
         "raw_catalog/fields/staging/file2.geojson",
@@ -92,3 +110,29 @@ def test_detect_new_s3_files_skips_when_no_new_files(fake_settings: SimpleNamesp
 
     assert run_requests == []
     assert json.loads(context.updated_cursor) == existing
+
+
+def test_detect_new_s3_files_stores_sorted_cursor(fake_settings: SimpleNamespace) -> None:
+    """
+    Test that the cursor is stored sorted and only unseen keys trigger runs.
+
+    Listing order must not change the cursor, so an unchanged prefix always
+    produces an identical cursor.
+    """
+    context = FakeContext(cursor=json.dumps(["raw_catalog/bbox/staging/a.geojson"]))
+    s3 = FakeS3Resource(keys=["raw_catalog/bbox/staging/b.geojson", "raw_catalog/bbox/staging/a.geojson"])
+
+    run_requests = list(
+        s3_file_sensor._detect_new_s3_files(
+            context=context,
+            s3=s3,
+            settings=fake_settings,
+            prefix="raw_catalog/bbox/staging",
+        )
+    )
+
+    assert [r.run_key for r in run_requests] == ["raw_catalog/bbox/staging/b.geojson"]
+    assert json.loads(context.updated_cursor) == [
+        "raw_catalog/bbox/staging/a.geojson",
+        "raw_catalog/bbox/staging/b.geojson",
+    ]
@@ -0,0 +1,598 @@
+import asyncio
+import hashlib
+import importlib
+import json
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import Request
+
+
+class FakePaginator:
+    __slots__ = ("client",)
+
+    def __init__(self, client: "FakeS3Client") -> None:
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str) -> list[dict[str, Any]]:
+        contents = [
+            {"Key": key, "ETag": etag} for key, (etag, _) in sorted(self.client.objects.items()) if key.startswith(Prefix)
+        ]
+        return [{"Contents": contents}]
+
+
+class FakeS3Client:
+    __slots__ = ("objects", "get_calls")
+
+    def __init__(self, objects: dict[str, tuple[str, dict[str, Any]]]) -> None:
+        self.objects = objects
+        self.get_calls: list[str] = []
+
+    def get_paginator(self, name: str) -> FakePaginator:
+        return FakePaginator(self)
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        self.get_calls.append(Key)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        etag, payload = self.objects[Key]
+        body = json.dumps(payload).encode("utf-8")
+        return {"Body": SimpleNamespace(read=lambda: body), "ETag": etag}
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict[str, str], ExpiresIn: int) -> str:
+        return f"http://s3/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ETag": self.objects[Key][0]}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str, **conditions: str) -> dict[str, Any]:
+        current = self.objects.get(Key, (None, None))[0]
+        if ("IfMatch" in conditions and conditions["IfMatch"] != current) or (
+            "IfNoneMatch" in conditions and current is not None
+        ):
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+        etag = f'"{hashlib.md5(Body).hexdigest()}"'
+        self.objects[Key] = (etag, json.loads(Body))
+        return {"ETag": etag}
+
+
+def make_item(field_id: str, index_type: str, date: str, bbox: list[float]) -> dict[str, Any]:
+    """
+    Create a minimal STAC item for testing.
+
+    Args:
+      field_id: Field ID
+      index_type: Index type (NDVI, NDMI)
+      date: Observation date (YYYY-MM-DD)
+      bbox: Item bounding box
+
+    Returns:
+      STAC item dictionary
+    """
+    return {
+        "type": "Feature",
+        "id": f"{field_id}-{index_type.lower()}-{date}",
+        "bbox": bbox,
+        "properties": {"datetime": f"{date}T00:00:00Z", "field_id": field_id, "index_type": index_type},
+    }
+
+
+def make_request(query: str = "", if_none_match: str | None = None) -> Request:
+    """
+    Create a minimal GET request for calling endpoints directly.
+
+    Args:
+      query: Raw query string
+      if_none_match: Optional If-None-Match header value
+
+    Returns:
+      Starlette request
+    """
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/",
+        "query_string": query.encode(),
+        "headers": headers,
+    }
+    return Request(scope)
+
+
+@pytest.fixture
+def stac_api(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_S3_ENDPOINT", "http://localhost:9000")
+    monkeypatch.setenv("AWS_S3_PIPELINE_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("AWS_S3_USE_SSL", "false")
+    monkeypatch.setenv("STAC_API_URL", "http://stac")
+    module = importlib.import_module("plantation_monitoring.api.stac_api")
+    monkeypatch.setattr(module, "_ITEM_CACHE", {})
+    monkeypatch.setattr(
+        module, "_ITEM_INDEX_STATE", {"etag": None, "saved_at": float("-inf"), "dirty": False, "loaded": False}
+    )
+    monkeypatch.setattr(module, "_SNAPSHOTS", OrderedDict())
+    monkeypatch.setattr(module, "_SNAPSHOT_EXPIRES_AT", {})
+    monkeypatch.setattr(module, "_SNAPSHOT_LOCKS", weakref.WeakValueDictionary())
+    return module
+
+
+def test_list_items_reuses_cache_until_etag_changes(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that _list_items only downloads new or modified items.
+
+    Verifies:
+    - Unchanged items are served from the cache
+    - Items with a new ETag are re-downloaded
+    - Deleted items are evicted from the cache
+    """
+    key_a = "catalog/items/f1/ndvi/2025-01-01.json"
+    key_b = "catalog/items/f2/ndvi/2025-01-01.json"
+    client = FakeS3Client(
+        {
+            key_a: ('"a1"', make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1])),
+            key_b: ('"b1"', make_item("f2", "NDVI", "2025-01-01", [1, 1, 2, 2])),
+        }
+    )
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    assert len(stac_api._list_items()) == 2
+    assert sorted(client.get_calls) == [stac_api.ITEM_INDEX_KEY, key_a, key_b]
+
+    client.get_calls.clear()
+    assert len(stac_api._list_items()) == 2
+    assert client.get_calls == []
+
+    client.objects[key_a] = ('"a2"', make_item("f1", "NDVI", "2025-01-02", [0, 0, 1, 1]))
+    del client.objects[key_b]
+    items = stac_api._list_items()
+    assert client.get_calls == [key_a]
+    assert [item["properties"]["datetime"] for item in items] == ["2025-01-02T00:00:00Z"]
+    assert set(stac_api._ITEM_CACHE) == {key_a}
+
+
+def test_list_items_seeds_cold_cache_from_index(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a cold worker seeds its cache from the persisted item index.
+
+    Verifies that items already recorded in the index with a matching ETag
+    are not downloaded again, while items missing from it are.
+    """
+    key_a = "catalog/items/f1/ndvi/2025-01-01.json"
+    key_b = "catalog/items/f2/ndvi/2025-01-01.json"
+    client = FakeS3Client({key_a: ('"a1"', make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1]))})
+    monkeypatch.setattr(stac_api, "s3_client", client)
+    stac_api._list_items()
+    assert stac_api.ITEM_INDEX_KEY in client.objects
+
+    client.objects[key_b] = ('"b1"', make_item("f2", "NDVI", "2025-01-01", [1, 1, 2, 2]))
+    client.get_calls.clear()
+    monkeypatch.setattr(stac_api, "_ITEM_CACHE", {})
+    monkeypatch.setitem(stac_api._ITEM_INDEX_STATE, "loaded", False)
+
+    assert len(stac_api._list_items()) == 2
+    assert client.get_calls == [stac_api.ITEM_INDEX_KEY, key_b]
+
+
+def test_list_items_reads_item_index_once_for_full_listings(
+    stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the persisted item index is only fetched by the first full listing.
+
+    Verifies that narrowed listings never read the index, and that a missing
+    index or an empty catalog is not fetched again on later listings.
+    """
+    client = FakeS3Client({})
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    stac_api._list_items("catalog/items/f1/")
+    assert client.get_calls == []
+
+    stac_api._list_items()
+    stac_api._list_items()
+    assert client.get_calls == [stac_api.ITEM_INDEX_KEY]
+
+
+def test_save_item_index_keeps_a_concurrent_writers_version(
+    stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the item index is only overwritten from the version last seen.
+
+    Verifies:
+    - A worker whose index version is stale does not overwrite the newer index
+    - It adopts the newer version, so its next save succeeds
+    - Unchanged listings and saves within the interval do not rewrite the index
+    """
+    key_a = "catalog/items/f1/ndvi/2025-01-01.json"
+    key_b = "catalog/items/f2/ndvi/2025-01-01.json"
+    client = FakeS3Client({key_a: ('"a1"', make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1]))})
+    monkeypatch.setattr(stac_api, "s3_client", client)
+    monkeypatch.setattr(stac_api, "ITEM_INDEX_SAVE_INTERVAL_SECONDS", 0.0)
+    stac_api._list_items()
+
+    client.objects[stac_api.ITEM_INDEX_KEY] = ('"other"', {})
+    client.objects[key_b] = ('"b1"', make_item("f2", "NDVI", "2025-01-01", [1, 1, 2, 2]))
+    stac_api._list_items()
+    assert client.objects[stac_api.ITEM_INDEX_KEY] == ('"other"', {})
+    assert stac_api._ITEM_INDEX_STATE["etag"] == '"other"'
+
+    del client.objects[key_b]
+    stac_api._list_items()
+    assert set(client.objects[stac_api.ITEM_INDEX_KEY][1]) == {key_a}
+
+    saved = client.objects[stac_api.ITEM_INDEX_KEY]
+    stac_api._list_items()
+    assert client.objects[stac_api.ITEM_INDEX_KEY] is saved
+
+
+def test_list_items_concurrent_prefix_refreshes_share_cache(
+    stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that refreshes of different prefixes can run in parallel threads.
+
+    Verifies that concurrent listings, evictions and catalog ETag
+    computations over the shared item cache neither raise nor lose entries.
+    """
+    objects = {
+        f"catalog/items/f{i}/ndvi/2025-01-01.json": (f'"{i}"', make_item(f"f{i}", "NDVI", "2025-01-01", [0, 0, 1, 1]))
+        for i in range(20)
+    }
+    monkeypatch.setattr(stac_api, "s3_client", FakeS3Client(dict(objects)))
+
+    def refresh(i: int) -> str:
+        stac_api._list_items(f"catalog/items/f{i % 20}/")
+        return stac_api._catalog_etag()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(refresh, range(200)))
+
+    assert set(stac_api._ITEM_CACHE) == set(objects)
+
+
+@pytest.mark.parametrize("tree_min_items", [0, 5000])
+def test_match_indices_bbox_returns_items_within_bbox(
+    stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch, tree_min_items: int
+) -> None:
+    """
+    Test that the bbox filter only returns items fully inside the query bbox.
+
+    Verifies that items touching the query edge are included, items extending
+    past it or without a bbox are excluded, and listing order is preserved,
+    both for the STRtree and the vectorised scan.
+    """
+    monkeypatch.setattr(stac_api, "BBOX_TREE_MIN_ITEMS", tree_min_items)
+    items = [
+        make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1]),
+        make_item("f2", "NDVI", "2025-01-01", [1, 1, 3, 3]),
+        make_item("f3", "NDVI", "2025-01-01", [1, 1, 2, 2]),
+        {**make_item("f4", "NDVI", "2025-01-01", []), "bbox": None},
+    ]
+    snapshot = stac_api._ItemSnapshot(items)
+
+    indices = stac_api._match_indices(snapshot, bbox=[0, 0, 2, 2])
+    assert [items[i]["properties"]["field_id"] for i in indices] == ["f1", "f3"]
+
+
+def test_match_indices_combines_field_and_index_type(stac_api: ModuleType) -> None:
+    """
+    Test that field_id and index_type filters intersect.
+
+    Verifies that only items matching both filters are returned and that
+    index_type matching is case-insensitive.
+    """
+    items = [
+        make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1]),
+        make_item("f1", "NDMI", "2025-01-01", [0, 0, 1, 1]),
+        make_item("f2", "NDVI", "2025-01-01", [0, 0, 1, 1]),
+    ]
+    snapshot = stac_api._ItemSnapshot(items)
+
+    indices = stac_api._match_indices(snapshot, field_id="f1", index_type="ndvi")
+    assert [items[i]["id"] for i in indices] == ["f1-ndvi-2025-01-01"]
+    assert stac_api._match_indices(snapshot, field_id="missing") == []
+
+
+def test_match_indices_datetime_prefix_and_interval(stac_api: ModuleType) -> None:
+    """
+    Test datetime filtering by prefix and by ISO 8601 interval.
+
+    Verifies:
+    - Prefix filters match on the item's datetime string, including its local date
+    - Interval bounds are inclusive
+    - Naive interval endpoints are treated as UTC
+    - Unparsable intervals match nothing
+    """
+    items = [
+        make_item("f1", "NDVI", "2025-01-15", [0, 0, 1, 1]),
+        make_item("f1", "NDVI", "2025-01-31", [0, 0, 1, 1]),
+        make_item("f1", "NDVI", "2025-02-01", [0, 0, 1, 1]),
+        make_item("f2", "NDVI", "2025-01-31", [0, 0, 1, 1]),
+    ]
+    items[3]["properties"]["datetime"] = "2025-01-31T23:00:00-05:00"
+    snapshot = stac_api._ItemSnapshot(items)
+
+    def dates(datetime_filter: str) -> list[str]:
+        indices = stac_api._match_indices(snapshot, datetime_filter=datetime_filter)
+        return [items[i]["properties"]["datetime"][:10] for i in indices]
+
+    assert dates("2025-01") == ["2025-01-15", "2025-01-31", "2025-01-31"]
+    assert dates("2025-01-31T2") == ["2025-01-31"]
+    assert dates("2025-02") == ["2025-02-01"]
+    assert dates("2025-01-31T00:00:00Z/2025-02-01T00:00:00Z") == ["2025-01-31", "2025-02-01"]
+    assert dates("2025-02-01T04:00:00Z/2025-02-01T04:00:00Z") == ["2025-01-31"]
+    assert dates("2025-01-16/2025-01-31T00:00:00") == ["2025-01-31"]
+    assert dates("not-a-date/2025-02-01") == []
+
+
+def test_get_item_returns_item_inline_by_default(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that get_item serves the item body unless a redirect is requested.
+
+    Verifies:
+    - The default response is the item JSON with the S3 ETag
+    - inline=False redirects with a 307 to a presigned URL for the item key
+    - A missing item is a 404 on both paths
+    """
+    key = "catalog/items/f1/ndvi/2025-01-01.json"
+    item = make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1])
+    client = FakeS3Client({key: ('"a1"', item)})
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    response = asyncio.run(stac_api.get_item(make_request(), "field-indices", "f1-ndvi-2025-01-01"))
+    assert json.loads(response.body) == item
+    assert response.headers["etag"] == '"a1"'
+
+    response = asyncio.run(stac_api.get_item(make_request(), "field-indices", "f1-ndvi-2025-01-01", inline=False))
+    assert response.status_code == 307
+    assert response.headers["location"] == f"http://s3/bucket/{key}?expires=300"
+
+    for inline in (True, False):
+        with pytest.raises(stac_api.HTTPException) as excinfo:
+            asyncio.run(stac_api.get_item(make_request(), "field-indices", "f2-ndvi-2025-01-01", inline=inline))
+        assert excinfo.value.status_code == 404
+
+
+def test_list_collection_items_honours_if_none_match(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the items endpoint returns caching headers and 304s.
+
+    Verifies:
+    - Responses carry a weak ETag and Cache-Control
+    - A matching If-None-Match yields an empty 304
+    - The ETag changes when the query or the catalog changes
+    """
+    key = "catalog/items/f1/ndvi/2025-01-01.json"
+    client = FakeS3Client({key: ('"a1"', make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1]))})
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    def list_items(query: str, if_none_match: str | None = None) -> Any:
+        return asyncio.run(
+            stac_api.list_collection_items(
+                make_request(query, if_none_match),
+                "field-indices",
+                limit=10,
+                offset=0,
+                bbox=None,
+                datetime=None,
+                field_id=None,
+                index_type=None,
+            )
+        )
+
+    response = list_items("limit=10")
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "public, max-age=30"
+    assert len(json.loads(response.body)["features"]) == 1
+
+    response = list_items("limit=10", if_none_match=etag)
+    assert response.status_code == 304
+    assert response.body == b""
+
+    response = list_items("limit=5")
+    assert response.headers["etag"] != etag
+
+    client.objects[key] = ('"a2"', make_item("f1", "NDVI", "2025-01-02", [0, 0, 1, 1]))
+    stac_api._SNAPSHOT_EXPIRES_AT.clear()
+    response = list_items("limit=10", if_none_match=etag)
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_current_snapshot_shares_one_refresh(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that concurrent requests share a single snapshot refresh.
+
+    Verifies that S3 is listed once for a burst of concurrent callers and
+    that the snapshot is reused until its TTL expires.
+    """
+    refreshes: list[int] = []
+
+    def fake_get_snapshot(prefix: str) -> Any:
+        refreshes.append(1)
+        snapshot = stac_api._ItemSnapshot([make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1])])
+        stac_api._SNAPSHOTS[prefix] = snapshot
+        return snapshot
+
+    monkeypatch.setattr(stac_api, "_get_snapshot", fake_get_snapshot)
+
+    async def burst() -> list[Any]:
+        return await asyncio.gather(*(stac_api._current_snapshot() for _ in range(5)))
+
+    snapshots = asyncio.run(burst())
+    assert len(refreshes) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert asyncio.run(stac_api._current_snapshot()) is snapshots[0]
+    assert len(refreshes) == 1
+
+
+def test_current_snapshot_bounds_prefixes_and_locks(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that per-prefix snapshots are capped and their locks are not kept.
+
+    Verifies that only the most recently used SNAPSHOT_MAX_ENTRIES snapshots
+    survive, and that no refresh lock outlives the requests using it.
+    """
+    monkeypatch.setattr(stac_api, "SNAPSHOT_MAX_ENTRIES", 2)
+    monkeypatch.setattr(stac_api, "_get_snapshot", lambda prefix: stac_api._ItemSnapshot([]))
+    prefixes = [f"catalog/items/f{i}/" for i in range(4)]
+
+    async def refresh_all() -> None:
+        await asyncio.gather(*(stac_api._current_snapshot(prefix) for prefix in prefixes))
+        await stac_api._current_snapshot(prefixes[-1])
+
+    asyncio.run(refresh_all())
+    assert len(stac_api._SNAPSHOTS) == len(stac_api._SNAPSHOT_EXPIRES_AT) == 2
+    assert list(stac_api._SNAPSHOTS)[-1] == prefixes[-1]
+    assert len(stac_api._SNAPSHOT_LOCKS) == 0
+
+
+def test_list_items_narrows_prefix_from_filters(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that filters narrow the listed S3 prefix.
+
+    Verifies:
+    - field_id, index_type and date prefixes map onto the item key layout
+    - Field IDs that do not fit the layout fall back to the full prefix
+    - Listing a prefix only fetches and evicts items under it
+    """
+    assert stac_api._items_prefix(None, "ndvi", None) == "catalog/items/"
+    assert stac_api._items_prefix("f1", None, "2025-01") == "catalog/items/f1/"
+    assert stac_api._items_prefix("f1", "NDVI", "2025-01") == "catalog/items/f1/ndvi/2025-01"
+    assert stac_api._items_prefix("f1", "NDVI", "2025-01-01/2025-02-01") == "catalog/items/f1/ndvi/"
+    assert stac_api._items_prefix("field-1", "NDVI", None) == "catalog/items/"
+
+    key_a = "catalog/items/f1/ndvi/2025-01-01.json"
+    key_b = "catalog/items/f2/ndvi/2025-01-01.json"
+    client = FakeS3Client(
+        {
+            key_a: ('"a1"', make_item("f1", "NDVI", "2025-01-01", [0, 0, 1, 1])),
+            key_b: ('"b1"', make_item("f2", "NDVI", "2025-01-01", [1, 1, 2, 2])),
+        }
+    )
+    monkeypatch.setattr(stac_api, "s3_client", client)
+    stac_api._list_items()
+
+    client.get_calls.clear()
+    client.objects[key_a] = ('"a2"', make_item("f1", "NDVI", "2025-01-02", [0, 0, 1, 1]))
+    items = stac_api._list_items("catalog/items/f1/")
+    assert [item["id"] for item in items] == ["f1-ndvi-2025-01-02"]
+    assert client.get_calls == [key_a]
+    assert set(stac_api._ITEM_CACHE) == {key_a, key_b}
+
+
+def test_list_collection_items_pages_with_offset(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test offset pagination on the items endpoint.
+
+    Verifies:
+    - Only the requested page is returned, with match counts
+    - A next link carries the advanced offset while more items match
+    - The last page has no next link
+    """
+    client = FakeS3Client(
+        {
+            f"catalog/items/f{i}/ndvi/2025-01-01.json": ('"e"', make_item(f"f{i}", "NDVI", "2025-01-01", [0, 0, 1, 1]))
+            for i in range(5)
+        }
+    )
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    def list_page(offset: int) -> dict[str, Any]:
+        response = asyncio.run(
+            stac_api.list_collection_items(
+                make_request(f"limit=2&offset={offset}"),
+                "field-indices",
+                limit=2,
+                offset=offset,
+                bbox=None,
+                datetime=None,
+                field_id=None,
+                index_type=None,
+            )
+        )
+        result: dict[str, Any] = json.loads(response.body)
+        return result
+
+    page = list_page(2)
+    assert [item["id"] for item in page["features"]] == ["f2-ndvi-2025-01-01", "f3-ndvi-2025-01-01"]
+    assert (page["numberMatched"], page["numberReturned"]) == (5, 2)
+    next_links = [link for link in page["links"] if link["rel"] == "next"]
+    assert next_links[0]["href"] == "/?limit=2&offset=4"
+
+    page = list_page(4)
+    assert page["numberReturned"] == 1
+    assert all(link["rel"] != "next" for link in page["links"])
+
+
+def test_search_items_reads_filters_from_body(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that /search takes its filters and paging from a SearchBody.
+
+    Verifies that filters are applied and that the next link asks the client
+    to merge the advanced offset into the original body.
+    """
+    client = FakeS3Client(
+        {
+            f"catalog/items/f1/{index}/2025-01-0{day}.json": (
+                '"e"',
+                make_item("f1", index.upper(), f"2025-01-0{day}", [0, 0, 1, 1]),
+            )
+            for index in ("ndvi", "ndmi")
+            for day in (1, 2, 3)
+        }
+    )
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    body = stac_api.SearchBody(field_id="f1", index_type="NDVI", limit=2)
+    response = asyncio.run(
+        stac_api.search_items(
+            make_request(), body, limit=None, offset=None, bbox=None, datetime=None, field_id=None, index_type=None
+        )
+    )
+    result = json.loads(response.body)
+
+    assert [item["id"] for item in result["features"]] == ["f1-ndvi-2025-01-01", "f1-ndvi-2025-01-02"]
+    next_link = next(link for link in result["links"] if link["rel"] == "next")
+    assert next_link["body"] == {"offset": 2}
+    assert next_link["merge"] is True
+
+
+def test_search_items_accepts_query_parameters(stac_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that POST /search still honours filters passed as query parameters.
+
+    Verifies:
+    - Without a body, results are filtered by the query parameters
+    - Body fields take precedence over query parameters
+    """
+    client = FakeS3Client(
+        {
+            f"catalog/items/f{i}/ndvi/2025-01-01.json": ('"e"', make_item(f"f{i}", "NDVI", "2025-01-01", [0, 0, 1, 1]))
+            for i in (1, 2)
+        }
+    )
+    monkeypatch.setattr(stac_api, "s3_client", client)
+
+    def ids(response: Any) -> list[str]:
+        return [item["id"] for item in json.loads(response.body)["features"]]
+
+    query = {"limit": None, "offset": None, "bbox": "0,0,1,1", "datetime": None, "index_type": None}
+    response = asyncio.run(stac_api.search_items(make_request("field_id=f2"), None, field_id="f2", **query))
+    assert ids(response) == ["f2-ndvi-2025-01-01"]
+
+    body = stac_api.SearchBody(field_id="f1")
+    response = asyncio.run(stac_api.search_items(make_request("field_id=f2"), body, field_id="f2", **query))
+    assert ids(response) == ["f1-ndvi-2025-01-01"]
@@ -1,14 +1,22 @@
+import json
 from types import SimpleNamespace
 from typing import Any
 
+import geopandas as gpd
+import numpy as np
+import pyarrow.parquet as pq
 import pytest
-from shapely.geometry import Polygon, mapping
+from botocore.exceptions import ClientError
+from shapely.geometry import MultiPolygon, Point, Polygon, mapping, shape
 
 from plantation_monitoring import storage
-from plantation_monitoring.models.models import Field
+from plantation_monitoring.geospatial import stac_publisher
+from plantation_monitoring.models.models import NDVI, Field
 
 
 class FakeS3Client:
+    __slots__ = ("put_calls",)
+
     def __init__(self) -> None:
         self.put_calls: list[dict[str, Any]] = []
 
@@ -16,8 +24,16 @@ class FakeS3Client:
         self.put_calls.append(kwargs)
         return {"ResponseMetadata": {"HTTPStatusCode": 200}}
 
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        for call in reversed(self.put_calls):
+            if call["Key"] == Key:
+                return {"Metadata": call.get("Metadata", {})}
+        raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
 
 class FakeS3Resource:
+    __slots__ = ("client",)
+
     def __init__(self) -> None:
         self.client = FakeS3Client()
 
@@ -64,13 +80,38 @@ def test_save_spectral_index_to_s3_writes_parquet(fake_settings: Any, fake_conte
         index_data=index,
     )
 
-    assert key == "field/field_1/ndvi/2024-10-10.parquet"
+    assert key == "pipeline-outputs/field_1/ndvi/2024-10-10.parquet"
     assert len(s3_resource.client.put_calls) == 1
     call = s3_resource.client.put_calls[0]
     assert call["Bucket"] == "test-bucket"
     assert call["Key"] == key
     assert call["ContentType"] == "application/parquet"
-    assert isinstance(call["Body"], bytes | bytearray)
+    assert hasattr(call["Body"], "read")
+    table = pq.read_table(call["Body"])
+    assert table.column("ndvi_valid_pixel_count").to_pylist() == [42]
+    assert b"geo" in table.schema.metadata
+
+
+def test_load_field_from_s3_geoparquet_reads_saved_statistics(fake_settings: Any, fake_context: Any) -> None:
+    """
+    Test that a GeoParquet row written by save_spectral_index_to_s3 loads back
+    into a Field whose index holds the statistics and no pixel values.
+    """
+    s3_resource = FakeS3Resource()
+    geom = mapping(Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]))
+    field = Field(id="field_1", plant_type="test", plant_date="2024-01-01", geom=geom)
+    index = NDVI(ndvi_mean=0.5, ndvi_std=0.1, ndvi_min=0.2, ndvi_max=0.8, ndvi_valid_pixel_count=42)
+    key = storage.save_spectral_index_to_s3(
+        fake_context, s3_resource, fake_settings, field, "2024-10-10", "field_1", "ndvi", index
+    )
+    body = s3_resource.client.put_calls[0]["Body"]
+    client = SimpleNamespace(get_object=lambda Bucket, Key: {"Body": body})
+
+    loaded = stac_publisher.load_field_from_s3_geoparquet(fake_context, client, "test-bucket", key, "ndvi", NDVI)
+
+    assert loaded.id == "field_1"
+    assert loaded.shapely_geom.equals(field.shapely_geom)
+    assert loaded.ndvi == index
 
 
 def test_publish_spectral_index_to_stac_calls_helpers(
@@ -91,7 +132,9 @@ def test_publish_spectral_index_to_stac_calls_helpers(
 
     called: dict[str, Any] = {}
 
-    def fake_ensure_catalog_structure(context: Any, s3: Any, settings: Any, bucket: str) -> None:
+    def fake_ensure_catalog_structure(
+        context: Any, s3: Any, settings: Any, bucket: str, s3_client: Any | None = None
+    ) -> None:
         called["ensure"] = (bucket,)
 
     def fake_create_stac_item_json(**kwargs: Any) -> dict[str, Any]:
@@ -103,7 +146,9 @@ def test_publish_spectral_index_to_stac_calls_helpers(
     ) -> None:
         called["add_links"] = (stac_item, bucket, field_id, index_name, date_str)
 
-    def fake_publish_stac_item_idempotent(context: Any, s3: Any, settings: Any, stac_item: dict[str, Any]) -> str:
+    def fake_publish_stac_item_idempotent(
+        context: Any, s3: Any, settings: Any, stac_item: dict[str, Any], s3_client: Any | None = None
+    ) -> str:
         called["publish"] = stac_item
         return "catalog/items/field_1/ndvi/2024-10-10.json"
 
@@ -129,6 +174,44 @@ def test_publish_spectral_index_to_stac_calls_helpers(
     assert result_key == "catalog/items/field_1/ndvi/2024-10-10.json"
 
 
+def test_publish_spectral_index_to_stac_skips_unchanged_items(
+    monkeypatch: pytest.MonkeyPatch, fake_settings: Any, fake_context: Any
+) -> None:
+    """
+    Test that republishing an unchanged spectral index issues no second PUT.
+
+    Verifies that a new process finds the stored content digest through
+    publish_spectral_index_to_stac and skips the upload, while changed
+    statistics are uploaded again.
+    """
+    monkeypatch.setattr(storage, "ensure_catalog_structure", lambda *args, **kwargs: None)
+    monkeypatch.setattr(stac_publisher, "_published_items", {})
+    s3_resource = FakeS3Resource()
+    geom = mapping(Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]))
+    index = NDVI(ndvi_mean=0.5, ndvi_std=0.1, ndvi_min=0.2, ndvi_max=0.8, ndvi_valid_pixel_count=42)
+
+    def publish(ndvi: NDVI) -> str:
+        field = Field(id="field_1", plant_type="test", plant_date="2024-01-01", geom=geom, ndvi=ndvi)
+        return storage.publish_spectral_index_to_stac(
+            context=fake_context,
+            s3=s3_resource,
+            settings=fake_settings,
+            field=field,
+            date_str="2024-10-10",
+            field_id="field_1",
+            index_name="ndvi",
+            s3_key="pipeline-outputs/field_1/ndvi/2024-10-10.parquet",
+        )
+
+    key = publish(index)
+    monkeypatch.setattr(stac_publisher, "_published_items", {})
+    assert publish(index) == key
+    assert [call["Key"] for call in s3_resource.client.put_calls] == [key]
+
+    publish(index.model_copy(update={"ndvi_mean": 0.6}))
+    assert [call["Key"] for call in s3_resource.client.put_calls] == [key, key]
+
+
 def test_extract_fields_from_geojson_returns_only_fields() -> None:
     """
     Test that extract_fields_from_geojson filters only field features.
@@ -232,3 +315,129 @@ def test_load_fields_from_s3_merges_processed_and_staging(
     assert {f.id for f in fields} == {"f1", "f2"}
     assert new_ids == {"f2"}
     assert ("staging", "processed") in calls
+
+
+@pytest.mark.parametrize(
+    "geom",
+    [
+        mapping(Polygon([(3, 1), (5, 2), (4, 6), (3, 1)], holes=[[(3.5, 2), (4, 3), (4, 2), (3.5, 2)]])),
+        mapping(MultiPolygon([Polygon([(0, 0), (1, 0), (1, 1)]), Polygon([(-2, 5), (-1, 5), (-1, 7)])])),
+        mapping(Point(2, 3)),
+    ],
+)
+def test_geojson_bounds_matches_shapely(geom: dict[str, Any]) -> None:
+    """
+    Test that the GeoJSON bbox helper agrees with shapely bounds.
+    """
+    assert stac_publisher._geojson_bounds(geom) == list(shape(geom).bounds)
+
+
+def test_publish_stac_item_idempotent_skips_repeat_puts(
+    monkeypatch: pytest.MonkeyPatch, fake_settings: Any, fake_context: Any
+) -> None:
+    """
+    Test that publishing the same STAC item twice in a process issues one PUT.
+    """
+    monkeypatch.setattr(stac_publisher, "_published_items", {})
+    s3_resource = FakeS3Resource()
+    stac_item = {"id": "field_1-ndvi-2024-01-01", "type": "Feature"}
+
+    first = stac_publisher.publish_stac_item_idempotent(fake_context, s3_resource, fake_settings, stac_item)
+    second = stac_publisher.publish_stac_item_idempotent(fake_context, s3_resource, fake_settings, stac_item)
+
+    assert first == second == "catalog/items/field_1/ndvi/2024-01-01.json"
+    assert len(s3_resource.client.put_calls) == 1
+    assert s3_resource.client.put_calls[0]["Metadata"][stac_publisher.STAC_DIGEST_METADATA_KEY]
+
+
+def test_publish_stac_item_idempotent_compares_stored_digest(
+    monkeypatch: pytest.MonkeyPatch, fake_settings: Any, fake_context: Any
+) -> None:
+    """
+    Test that a new process skips the PUT for an unchanged item already in S3
+    and replaces the item when its content changed.
+    """
+    monkeypatch.setattr(stac_publisher, "_published_items", {})
+    s3_resource = FakeS3Resource()
+    stac_item = {"id": "field_1-ndvi-2024-01-01", "type": "Feature", "properties": {"ndvi_mean": 0.5}}
+    stac_publisher.publish_stac_item_idempotent(fake_context, s3_resource, fake_settings, stac_item)
+
+    monkeypatch.setattr(stac_publisher, "_published_items", {})
+    stac_publisher.publish_stac_item_idempotent(fake_context, s3_resource, fake_settings, dict(stac_item))
+    assert len(s3_resource.client.put_calls) == 1
+
+    changed = {**stac_item, "properties": {"ndvi_mean": 0.6}}
+    stac_publisher.publish_stac_item_idempotent(fake_context, s3_resource, fake_settings, changed)
+    assert len(s3_resource.client.put_calls) == 2
+    assert json.loads(s3_resource.client.put_calls[1]["Body"])["properties"] == {"ndvi_mean": 0.6}
+
+
+def test_stac_dumps_is_key_order_independent() -> None:
+    """
+    Test that STAC objects serialize to the same bytes regardless of key order
+    and that NumPy statistics are accepted.
+    """
+    first = stac_publisher._dumps({"id": "a", "properties": {"mean": np.float32(0.5), "count": 2}})
+    second = stac_publisher._dumps({"properties": {"count": 2, "mean": np.float32(0.5)}, "id": "a"})
+
+    assert first == second
+    assert first == b'{"id":"a","properties":{"count":2,"mean":0.5}}'
+
+
+def test_features_to_geodataframe_matches_from_features() -> None:
+    """
+    Test that the vectorized GeoJSON conversion matches GeoDataFrame.from_features,
+    including features without a geometry.
+    """
+    features = [
+        {"type": "Feature", "properties": {"object-id": 1}, "geometry": mapping(Point(1, 2).buffer(1))},
+        {"type": "Feature", "properties": {"object-id": 2}, "geometry": None},
+    ]
+
+    gdf = storage._features_to_geodataframe(features)
+    expected = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+
+    assert gdf.crs == expected.crs
+    assert gdf["object-id"].tolist() == [1, 2]
+    assert gdf.geometry.iloc[0].equals(expected.geometry.iloc[0])
+    assert gdf.geometry.iloc[1] is None
+
+
+class FakeBucketClient:
+    __slots__ = ("keys", "copy_calls", "delete_calls")
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = keys
+        self.copy_calls: list[dict[str, Any]] = []
+        self.delete_calls: list[dict[str, Any]] = []
+
+    def get_paginator(self, name: str) -> Any:
+        return SimpleNamespace(paginate=self.paginate)
+
+    def paginate(self, Bucket: str, Prefix: str) -> list[dict[str, Any]]:
+        objects = [{"Key": k, "Size": 1} for k in self.keys if k.startswith(Prefix)]
+        return [{"Contents": objects[start : start + 1000]} for start in range(0, len(objects), 1000)]
+
+    def copy_object(self, **kwargs: Any) -> None:
+        self.copy_calls.append(kwargs)
+
+    def delete_objects(self, **kwargs: Any) -> dict[str, Any]:
+        self.delete_calls.append(kwargs)
+        return {}
+
+
+def test_move_s3_files_copies_then_deletes_in_batches(fake_settings: Any) -> None:
+    """
+    Test that move_s3_files copies every object server-side and removes the
+    sources with DeleteObjects batches of at most 1000 keys.
+    """
+    keys = [f"staging/{i:04d}.geojson" for i in range(1001)]
+    client = FakeBucketClient(keys)
+    context = SimpleNamespace(log=SimpleNamespace(debug=lambda *_: None, error=lambda *_: None))
+
+    storage.move_s3_files(context, SimpleNamespace(get_client=lambda: client), fake_settings, "staging", "processed")
+
+    assert sorted(call["Key"] for call in client.copy_calls) == [k.replace("staging", "processed") for k in keys]
+    assert all(call["CopySource"]["Bucket"] == "test-bucket" for call in client.copy_calls)
+    assert [len(call["Delete"]["Objects"]) for call in client.delete_calls] == [1000, 1]
+    assert [obj["Key"] for call in client.delete_calls for obj in call["Delete"]["Objects"]] == keys